@@ -1,19 +1,109 @@
-﻿import os
+﻿import time
+
+_PROCESS_START = time.perf_counter()
+
+import os
+import argparse
+import csv
+import functools
+import hashlib
+import io
 import json
+import math
+import mmap
+import queue
+import re
+import socket
+import stat
+import struct
 import sys
-import time
+import threading
 import tkinter as tk
-from tkinter import colorchooser, filedialog
-
-try:
-    from PIL import Image, ImageTk
-except ImportError:
-    Image = None
-    ImageTk = None
+import tkinter.font as tkfont
+import types
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+
+# Pillow is imported on first use (see load_pillow) so the first clock frame
+# never waits for it.
+Image = None
+ImageTk = None
+_pillow_lock = threading.Lock()
+_pillow_checked = False
+# asyncio is only needed by the optional servers (see load_asyncio); its
+# import costs more than Pillow's, so a plain clock never pays for it.
+asyncio = None
 
 APP_VERSION = 'V1.0'
 CONFIG_FILENAME = 'user_state.json'
 
+STYLE_FRAME_MS = 16
+FONT_STYLE_KEYS = frozenset({
+    'time_font_size', 'text_font_size', 'time_font_family', 'time_bold',
+    'time_shadow', 'text_font_family', 'text_bold', 'auto_fit',
+})
+
+STATE_SCHEMA_VERSION = 2
+STATE_SAVE_DEBOUNCE_MS = 750
+STATE_FLUSH_TIMEOUT_S = 2.0
+
+BG_FADE_MS = 320
+BG_FADE_FRAME_MS = 16
+
+METRICS_RECENT = 240
+METRICS_OVERLAY_MS = 500
+LATENESS_BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 250)
+
+DISPLAY_GEOMETRY_RE = re.compile(r'^(\d+)x(\d+)([+-]\d+)([+-]\d+)$')
+DISPLAY_RESIZE_DEBOUNCE_MS = 300
+
+STATUS_POS = (28, 24)
+STATUS_FONT = ('Segoe UI', 13)
+STATUS_COLOR = '#5a5a7a'
+
+TICK_SLACK_MS = 4
+TICK_IDLE_MS = 1000
+TICK_PRECISE_LEAD_MS = 20
+
+
+def load_pillow() -> bool:
+    """Import Pillow on first call; returns False when it is not installed."""
+    global Image, ImageTk, _pillow_checked
+    with _pillow_lock:
+        if not _pillow_checked:
+            _pillow_checked = True
+            try:
+                from PIL import Image as pil_image, ImageTk as pil_imagetk
+            except ImportError:
+                return False
+            Image, ImageTk = pil_image, pil_imagetk
+    return Image is not None
+
+
+class StartupProfiler:
+    """Records named startup phases relative to process start."""
+
+    def __init__(self, enabled: bool = False) -> None:
+        self.enabled = enabled
+        self.marks: list[tuple[str, float]] = []
+        self._reported = False
+
+    def mark(self, phase: str) -> None:
+        if self.enabled:
+            self.marks.append((phase, time.perf_counter()))
+
+    def report(self) -> None:
+        if not self.enabled or self._reported:
+            return
+        self._reported = True
+        out = sys.__stdout__ if sys.__stdout__ else sys.stderr
+        print('[Full-Screen-Clock] startup profile', file=out)
+        prev = _PROCESS_START
+        for phase, at in self.marks:
+            print(f'  {phase:<20} {(at - _PROCESS_START) * 1000:8.1f} ms  (+{(at - prev) * 1000:.1f})', file=out)
+            prev = at
+
+
 # ── Dark-themed dialog helpers ──────────────────────────────────────────────
 
 
@@ -272,14 +362,2452 @@ def dark_asktext(
     return result[0]
 
 
+# ── Background image pipeline ───────────────────────────────────────────────
+
+BG_PYRAMID_MIN_SIDE = 256
+BG_RENDER_CACHE_ENTRIES = 12
+BG_RENDER_CACHE_BYTES = 128 * 1024 * 1024
+BG_SOURCE_CACHE_ENTRIES = 4
+BG_SOURCE_CACHE_BYTES = 192 * 1024 * 1024
+BG_POLL_MS = 15
+# Live resizes and zoom drags show a NEAREST preview every frame; the
+# LANCZOS render replaces it once input has been quiet this long.
+BG_REFINE_DELAY_MS = 150
+
+RENDITION_DIRNAME = 'renditions'
+RENDITION_CACHE_BYTES = 256 * 1024 * 1024
+# A .tmp file younger than this may still be written by another clock process.
+RENDITION_TMP_GRACE_S = 600
+# Raw renditions: magic, width, height, pixel mode, then 4-byte pixels.
+RENDITION_RAW_MAGIC = b'FSCR'
+RENDITION_RAW_HEADER = struct.Struct('<4sII4s')
+
+# Animated backgrounds: frames rendered at display size live in their own
+# LRU. Animations that would take more than half of it are streamed, a few
+# frames ahead of playback, instead of being rendered up front.
+BG_ANIMATED_EXTENSIONS = frozenset({'.gif', '.png', '.apng', '.webp'})
+BG_FRAME_CACHE_BYTES = 192 * 1024 * 1024
+BG_FRAME_STREAM_AHEAD = 8
+BG_FRAME_DEFAULT_MS = 100
+BG_FRAME_MIN_MS = 20
+BG_FRAME_TICK_GUARD_MS = 8
+
+SLIDESHOW_EXTENSIONS = frozenset({'.png', '.jpg', '.jpeg', '.bmp', '.gif', '.ppm', '.pgm', '.webp'})
+SLIDESHOW_DEFAULT_INTERVAL_S = 60
+SLIDESHOW_MIN_INTERVAL_S = 2
+SLIDESHOW_PREFETCH = 2
+
+
+def _image_nbytes(img) -> int:
+    return img.width * img.height * len(img.getbands())
+
+
+class BackgroundSizeError(ValueError):
+    pass
+
+
+def background_dst_size(src_size: tuple[int, int], width: int, height: int,
+                        scale_percent: int) -> tuple[int, int]:
+    src_w, src_h = src_size
+    base_scale = max(width / src_w, height / src_h)
+    final_scale = base_scale * (scale_percent / 100.0)
+    return max(int(src_w * final_scale), 1), max(int(src_h * final_scale), 1)
+
+
+def background_view(src_size: tuple[int, int], width: int, height: int,
+                    scale_percent: int) -> tuple[tuple[float, float, float, float], tuple[int, int]]:
+    """Return the visible source rectangle and the size it is drawn at.
+
+    The scaled background is centred on the canvas; anything past the window
+    edge would be clipped anyway, so only the part that lands inside the
+    window is resampled. The output is never larger than the window.
+    """
+    src_w, src_h = src_size
+    dst_w, dst_h = background_dst_size(src_size, width, height, scale_percent)
+    out_w, out_h = min(dst_w, width), min(dst_h, height)
+    left = (dst_w - out_w) // 2
+    top = (dst_h - out_h) // 2
+    sx, sy = src_w / dst_w, src_h / dst_h
+    box = (left * sx, top * sy, (left + out_w) * sx, (top + out_h) * sy)
+    return box, (out_w, out_h)
+
+
+def _normalize_mode(image):
+    if image.mode in ('RGB', 'RGBA'):
+        return image
+    has_alpha = 'A' in image.getbands() or 'transparency' in image.info
+    return image.convert('RGBA' if has_alpha else 'RGB')
+
+
+def decode_background(path: str, width: int, height: int, scale_percent: int):
+    """Decode ``path`` at the smallest resolution that still covers the target.
+
+    JPEGs use DCT scaling via ``draft`` so large photos are never expanded to
+    full size; other formats are decoded fully and then box-reduced by a
+    power of two. Returns ``(image, full_size)``.
+    """
+    src = Image.open(path)
+    try:
+        full_size = src.size
+        if full_size[0] <= 0 or full_size[1] <= 0:
+            raise BackgroundSizeError(f'{full_size[0]}x{full_size[1]}')
+        need_w, need_h = background_dst_size(full_size, width, height, scale_percent)
+        if src.format == 'JPEG':
+            src.draft('RGB', (need_w, need_h))
+        src.load()
+    except Exception:
+        src.close()
+        raise
+    img = _normalize_mode(src)
+    factor = 1
+    while img.width >= need_w * factor * 2 and img.height >= need_h * factor * 2:
+        factor *= 2
+    if factor > 1:
+        img = img.reduce(factor)
+    return img, full_size
+
+
+class BackgroundPyramid:
+    """Power-of-two reductions of a decoded background, built once on load.
+
+    ``size`` is the full source size used for layout; level 0 may be smaller
+    when the source was decoded at reduced resolution.
+    """
+
+    def __init__(self, image, full_size: tuple[int, int] | None = None) -> None:
+        image = _normalize_mode(image)
+        self.size = full_size or image.size
+        self.levels = [image]
+        while min(self.levels[-1].size) >= BG_PYRAMID_MIN_SIDE * 2:
+            self.levels.append(self.levels[-1].reduce(2))
+
+    def nbytes(self) -> int:
+        return sum(_image_nbytes(level) for level in self.levels)
+
+    def covers(self, dst_w: int, dst_h: int) -> bool:
+        base = self.levels[0]
+        if base.size == self.size:
+            return True
+        return base.width >= dst_w and base.height >= dst_h
+
+    def level_for(self, dst_w: int, dst_h: int):
+        # Smallest level that still covers the target, so resampling never
+        # has to upscale a level that a larger one could have served.
+        chosen = self.levels[0]
+        for level in self.levels[1:]:
+            if level.width < dst_w or level.height < dst_h:
+                break
+            chosen = level
+        return chosen
+
+
+class RenderCache:
+    """LRU of finished background renders, bounded by entry count and bytes.
+
+    ``sizeof`` measures an entry; the default counts raw image pixels.
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int, sizeof=_image_nbytes) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._sizeof = sizeof
+        self._items: OrderedDict = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        with self._lock:
+            img = self._items.get(key)
+            if img is None:
+                self.misses += 1
+                return None
+            self._items.move_to_end(key)
+            self.hits += 1
+            return img
+
+    def __contains__(self, key) -> bool:
+        with self._lock:
+            return key in self._items
+
+    def put(self, key, img) -> None:
+        size = self._sizeof(img)
+        with self._lock:
+            old = self._items.pop(key, None)
+            if old is not None:
+                self._bytes -= self._sizeof(old)
+            if size > self.max_bytes:
+                return
+            self._items[key] = img
+            self._bytes += size
+            while len(self._items) > self.max_entries or self._bytes > self.max_bytes:
+                _, evicted = self._items.popitem(last=False)
+                self._bytes -= self._sizeof(evicted)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+            self._bytes = 0
+
+
+class RenditionCache:
+    """Finished background renders on disk, so a restart skips the decode.
+
+    Files live in one directory, named by a hash of the source path, its
+    mtime and size, the target size and the scale; editing the source
+    therefore never serves a stale render. RGB renders are stored as binary
+    PPM and RGBA ones as PNG at the lowest compression level, both of which
+    load without real decoding work. The directory is capped at
+    ``max_bytes``; the least recently used files go first. Every failure is
+    treated as a miss: the cache is an optimisation, never an error source.
+
+    With ``raw`` set, renders are stored as uncompressed RGBX/RGBA pixels
+    behind a small header and loaded by memory-mapping the file straight
+    into ``Image.frombuffer``: nothing is decoded or copied, and clock
+    processes showing the same background share the pages in the OS cache.
+    """
+
+    def __init__(self, directory: str, max_bytes: int = RENDITION_CACHE_BYTES, *,
+                 raw: bool = False) -> None:
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.raw = raw
+
+    def _stem(self, path: str, width: int, height: int, scale_percent: int) -> str | None:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        ident = f'{os.path.abspath(path)}|{st.st_mtime_ns}|{st.st_size}|{width}x{height}|{scale_percent}'
+        return os.path.join(self.directory, hashlib.sha1(ident.encode('utf-8')).hexdigest())
+
+    def load(self, path: str, width: int, height: int, scale_percent: int):
+        stem = self._stem(path, width, height, scale_percent)
+        if stem is None:
+            return None
+        for ext in (('.raw', '.ppm', '.png') if self.raw else ('.ppm', '.png')):
+            filename = stem + ext
+            try:
+                if ext == '.raw':
+                    img = self._map_raw(filename)
+                else:
+                    with Image.open(filename) as cached:
+                        cached.load()
+                        img = _normalize_mode(cached)
+                        if img is cached:
+                            img = cached.copy()
+            except FileNotFoundError:
+                continue
+            except Exception:
+                self._discard(filename)
+                continue
+            try:
+                os.utime(filename)  # recency for eviction
+            except OSError:
+                pass
+            return img
+        return None
+
+    def store(self, path: str, width: int, height: int, scale_percent: int, img) -> None:
+        stem = self._stem(path, width, height, scale_percent)
+        if stem is None:
+            return
+        ext, options = ('.png', {'compress_level': 1}) if img.mode == 'RGBA' else ('.ppm', {})
+        if self.raw:
+            ext = '.raw'
+        tmp = f'{stem}.{os.getpid()}.tmp'
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            if self.raw:
+                self._write_raw(tmp, img)
+            else:
+                img.save(tmp, format=ext[1:].upper(), **options)
+            os.replace(tmp, stem + ext)
+        except Exception:
+            self._discard(tmp)
+            return
+        self._evict()
+
+    def _evict(self) -> None:
+        try:
+            entries = [e for e in os.scandir(self.directory) if e.is_file()]
+        except OSError:
+            return
+        now = time.time()
+        stats = []
+        for entry in entries:
+            try:
+                st = entry.stat()
+            except OSError:
+                continue  # removed by another process meanwhile
+            if entry.name.endswith('.tmp') and now - st.st_mtime < RENDITION_TMP_GRACE_S:
+                continue
+            stats.append((st.st_mtime, st.st_size, entry.path))
+        total = sum(size for _, size, _ in stats)
+        for _, size, filename in sorted(stats):
+            if total <= self.max_bytes:
+                break
+            self._discard(filename)
+            total -= size
+
+    @staticmethod
+    def _write_raw(filename: str, img) -> None:
+        # RGB is padded to RGBX: Pillow can only map 4-byte pixels in place.
+        mode = 'RGBA' if img.mode == 'RGBA' else 'RGBX'
+        pixels = img if img.mode == mode else img.convert(mode)
+        with open(filename, 'wb') as f:
+            f.write(RENDITION_RAW_HEADER.pack(RENDITION_RAW_MAGIC, img.width, img.height,
+                                              mode.encode('ascii')))
+            f.write(pixels.tobytes())
+
+    @staticmethod
+    def _map_raw(filename: str):
+        with open(filename, 'rb') as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, width, height, mode = RENDITION_RAW_HEADER.unpack_from(mapped)
+            mode = mode.decode('ascii')
+            if (magic != RENDITION_RAW_MAGIC or mode not in ('RGBX', 'RGBA')
+                    or len(mapped) != RENDITION_RAW_HEADER.size + width * height * 4):
+                raise ValueError
+        except (struct.error, ValueError):  # UnicodeDecodeError is a ValueError
+            # An open mapping would also keep Windows from deleting the file.
+            mapped.close()
+            raise ValueError(f'corrupt raw rendition: {filename}') from None
+        # The image keeps the mapping alive; its pixels are the file's pages.
+        pixels = memoryview(mapped)[RENDITION_RAW_HEADER.size:]
+        return Image.frombuffer(mode, (width, height), pixels, 'raw', mode, 0, 1)
+
+    @staticmethod
+    def _discard(filename: str) -> None:
+        try:
+            os.remove(filename)
+        except OSError:
+            pass
+
+
+class BackgroundRenderer:
+    """Decodes and resamples backgrounds on a worker thread.
+
+    Each render target (the main window, or one window per extra display)
+    has at most one live job: ``submit`` hands out a new generation for that
+    target, and queued or running jobs from an older generation bail out at
+    their next checkpoint. All targets share the decoded sources and one
+    render cache, both byte-bounded LRUs keyed by path, so a slideshow can
+    keep the next few images warm. Renders missing from memory are looked
+    up in the optional on-disk ``disk`` cache before anything is decoded.
+    Results land on ``results`` as ``(target, generation, image, error)``
+    for the Tk loop to drain.
+    """
+
+    def __init__(self, disk: RenditionCache | None = None) -> None:
+        self.disk = disk
+        self.cache = RenderCache(BG_RENDER_CACHE_ENTRIES, BG_RENDER_CACHE_BYTES)
+        self.sources = RenderCache(BG_SOURCE_CACHE_ENTRIES, BG_SOURCE_CACHE_BYTES,
+                                   sizeof=BackgroundPyramid.nbytes)
+        self.frames = RenderCache(100_000, BG_FRAME_CACHE_BYTES, sizeof=lambda entry: _image_nbytes(entry[0]))
+        self.results: queue.Queue = queue.Queue()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='clock-bg')
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._current: dict[str, int] = {}
+        self._animation_source = None  # (path, open image); only touched by the worker
+        self.animated: dict[str, bool] = {}  # path -> more than one frame, once probed
+
+    def submit(self, path: str, width: int, height: int, scale_percent: int,
+               target: str = 'main') -> int:
+        with self._lock:
+            self._generation += 1
+            generation = self._current[target] = self._generation
+        self._executor.submit(self._run, target, generation, path, width, height, scale_percent)
+        return generation
+
+    def submit_animation(self, path: str, width: int, height: int, scale_percent: int,
+                         start: int = 0, target: str = 'animation') -> int:
+        """Render animation frames for ``path`` into ``frames``.
+
+        Small animations are rendered completely; larger ones get the
+        ``BG_FRAME_STREAM_AHEAD`` frames from ``start`` on. The result is
+        ``((path, width, height, scale_percent), frame_count, streamed)``, or
+        ``None`` for a still image.
+        """
+        with self._lock:
+            self._generation += 1
+            generation = self._current[target] = self._generation
+        self._executor.submit(self._run_animation, target, generation, path, width, height,
+                              scale_percent, start)
+        return generation
+
+    def cancel(self, target: str | None = None) -> None:
+        with self._lock:
+            if target is None:
+                self._current.clear()
+            else:
+                self._current.pop(target, None)
+
+    def invalidate(self) -> None:
+        """Drop decoded sources so the next job re-reads them from disk."""
+        with self._lock:
+            self._current.clear()
+        self.sources.clear()
+        self.cache.clear()
+        self.frames.clear()
+        self.animated.clear()
+
+    def preview(self, path: str, width: int, height: int, scale_percent: int):
+        """Cheap render from an already decoded source, or None if there is none.
+
+        Runs on the calling thread; decoded pyramids are never modified, so
+        reading one here while the worker renders from it is safe.
+        """
+        pyramid = self.sources.get(path)
+        if pyramid is None:
+            return None
+        return self._resample(pyramid, width, height, scale_percent, preview=True)
+
+    def is_current(self, target: str, generation: int) -> bool:
+        return self._current.get(target) == generation
+
+    def release_animation(self) -> None:
+        """Close the file handle kept open for the last animation."""
+        self._executor.submit(self._close_animation_source)
+
+    def shutdown(self) -> None:
+        # Queued jobs see they are no longer current and return at once, so
+        # the handle is closed right after whatever is running now.
+        self.cancel()
+        self.release_animation()
+        self._executor.shutdown(wait=False)
+
+    def _close_animation_source(self) -> None:
+        if self._animation_source is not None:
+            self._animation_source[1].close()
+            self._animation_source = None
+
+    def _load(self, path: str, width: int, height: int, scale_percent: int) -> BackgroundPyramid:
+        pyramid = self.sources.get(path)
+        if pyramid is not None:
+            dst_w, dst_h = background_dst_size(pyramid.size, width, height, scale_percent)
+            if pyramid.covers(dst_w, dst_h):
+                return pyramid
+        # First use, or the scale now asks for more pixels than were decoded.
+        image, full_size = decode_background(path, width, height, scale_percent)
+        pyramid = BackgroundPyramid(image, full_size)
+        self.sources.put(path, pyramid)
+        return pyramid
+
+    def _run(self, target: str, generation: int, path: str, width: int, height: int,
+             scale_percent: int) -> None:
+        if not self.is_current(target, generation):
+            return
+        key = (path, width, height, scale_percent)
+        rendered = False
+        try:
+            # Another display of the same size may have rendered this already.
+            resized = self.cache.get(key)
+            if resized is None and self.disk is not None:
+                resized = self.disk.load(*key)
+            if resized is None:
+                pyramid = self._load(path, width, height, scale_percent)
+                if not self.is_current(target, generation):
+                    return
+                resized = self._resample(pyramid, width, height, scale_percent)
+                rendered = True
+            self.cache.put(key, resized)
+        except Exception as exc:
+            self.results.put((target, generation, None, exc))
+            return
+        self.results.put((target, generation, resized, None))
+        if rendered and self.disk is not None:
+            self.disk.store(*key, resized)  # after the result, off the paint path
+
+    def _run_animation(self, target: str, generation: int, path: str, width: int, height: int,
+                       scale_percent: int, start: int) -> None:
+        if not self.is_current(target, generation):
+            return
+        try:
+            info = self._render_frames(target, generation, path, width, height, scale_percent, start)
+        except Exception as exc:
+            self.results.put((target, generation, None, exc))
+            return
+        self.results.put((target, generation, info, None))
+
+    def _render_frames(self, target: str, generation: int, path: str, width: int, height: int,
+                       scale_percent: int, start: int):
+        if self._animation_source is None or self._animation_source[0] != path:
+            self._close_animation_source()
+            self._animation_source = (path, Image.open(path))
+        source = self._animation_source[1]
+        count = getattr(source, 'n_frames', 1)
+        self.animated[path] = count > 1
+        if count < 2:
+            self._close_animation_source()
+            return None
+        box, out_size = background_view(source.size, width, height, scale_percent)
+        key = (path, width, height, scale_percent)
+        streamed = count * out_size[0] * out_size[1] * 4 > BG_FRAME_CACHE_BYTES // 2
+        if streamed:
+            indices = [(start + k) % count for k in range(min(BG_FRAME_STREAM_AHEAD, count))]
+        else:
+            indices = range(count)
+        for index in indices:
+            if not self.is_current(target, generation):
+                return None
+            if key + (index,) in self.frames:
+                continue
+            source.seek(index)
+            frame = _normalize_mode(source).resize(out_size, Image.Resampling.BILINEAR, box=box,
+                                                   reducing_gap=2.0)
+            duration = max(int(source.info.get('duration') or BG_FRAME_DEFAULT_MS), BG_FRAME_MIN_MS)
+            self.frames.put(key + (index,), (frame, duration))
+        return key, count, streamed
+
+    @staticmethod
+    def _resample(pyramid: BackgroundPyramid, width: int, height: int, scale_percent: int,
+                  *, preview: bool = False):
+        dst_w, dst_h = background_dst_size(pyramid.size, width, height, scale_percent)
+        (x0, y0, x1, y1), out_size = background_view(pyramid.size, width, height, scale_percent)
+        # Final renders filter the smallest covering level with LANCZOS; a
+        # preview point-samples a level of half the needed resolution.
+        if preview:
+            level = pyramid.level_for(dst_w // 2, dst_h // 2)
+            resample = Image.Resampling.NEAREST
+        else:
+            level = pyramid.level_for(dst_w, dst_h)
+            resample = Image.Resampling.LANCZOS
+        fx = level.width / pyramid.size[0]
+        fy = level.height / pyramid.size[1]
+        box = (x0 * fx, y0 * fy, x1 * fx, y1 * fy)
+        return level.resize(out_size, resample, box=box)
+
+
+def load_slideshow(source: str) -> list[str]:
+    """Image paths from a folder (sorted by name) or a playlist file.
+
+    Playlists hold one path per line; blank lines and ``#`` comments are
+    skipped and relative paths resolve against the playlist's folder.
+    """
+    if os.path.isdir(source):
+        names = sorted(os.listdir(source), key=str.lower)
+        candidates = [os.path.join(source, name) for name in names
+                      if os.path.splitext(name)[1].lower() in SLIDESHOW_EXTENSIONS]
+    else:
+        base = os.path.dirname(os.path.abspath(source))
+        with open(source, 'r', encoding='utf-8-sig') as f:
+            lines = [line.strip() for line in f]
+        candidates = [os.path.join(base, os.path.expanduser(line))
+                      for line in lines if line and not line.startswith('#')]
+    return [path for path in candidates if os.path.isfile(path)]
+
+
+def place_background_item(canvas: tk.Canvas, photo, width: int, height: int) -> None:
+    """Centre ``photo`` on the canvas, retargeting the existing 'bg' item if any."""
+    x = (width - photo.width()) // 2
+    y = (height - photo.height()) // 2
+    items = canvas.find_withtag('bg')
+    if items:
+        canvas.itemconfigure(items[0], image=photo)
+        canvas.coords(items[0], x, y)
+        if len(items) > 1:
+            canvas.delete(*items[1:])
+    else:
+        canvas.create_image(x, y, image=photo, anchor='nw', tags='bg')
+        canvas.tag_lower('bg')
+
+
+def _compose_frame(buffer, img, color: str) -> None:
+    """Draw ``img`` centred on ``color`` into ``buffer`` in place."""
+    buffer.paste(color, (0, 0, *buffer.size))
+    if img is not None:
+        offset = ((buffer.width - img.width) // 2, (buffer.height - img.height) // 2)
+        buffer.paste(img, offset, img if img.mode == 'RGBA' else None)
+
+
+class CrossFade:
+    """Cross-fades a canvas's 'bg' item between two backgrounds.
+
+    Frames are built incrementally in one working buffer: each frame pastes
+    the target over the previous frame through a uniform mask chosen so the
+    result equals the blend for the elapsed time. The working buffer, target
+    buffer, mask and PhotoImage are reused by later fades of the same size.
+    Progress follows the clock, so a frame that overruns its budget makes
+    the next one skip ahead; skipped frames are counted in ``dropped``.
+    """
+
+    def __init__(self, widget: tk.Misc, metrics=None) -> None:
+        self.widget = widget
+        self.metrics = metrics
+        self.dropped = 0
+        self._work = None
+        self._end = None
+        self._mask = None
+        self._photo = None
+        self._after_id = None
+        self._on_done = None
+        self._alpha = 0.0
+        self._started = 0.0
+        self._last_frame = 0.0
+
+    @property
+    def active(self) -> bool:
+        return self._after_id is not None
+
+    def start(self, canvas: tk.Canvas, old, new, color: str, size: tuple[int, int], on_done) -> None:
+        """Fade from ``old`` to ``new``; ``None`` on either side means plain ``color``.
+
+        ``on_done`` runs once the fade completes and should put the final
+        background on the canvas. A fade started while another is running
+        continues from the frame currently on screen.
+        """
+        resume = self.active and self._work.size == size
+        self.cancel()
+        if self._work is None or self._work.size != size:
+            self._work = Image.new('RGB', size)
+            self._end = Image.new('RGB', size)
+            self._mask = Image.new('L', size)
+            self._photo = None
+        if not resume:
+            _compose_frame(self._work, old, color)
+        _compose_frame(self._end, new, color)
+        if self._photo is None:
+            self._photo = ImageTk.PhotoImage(self._work)
+        else:
+            self._photo.paste(self._work)
+        place_background_item(canvas, self._photo, *size)
+        self._on_done = on_done
+        self._alpha = 0.0
+        self._started = self._last_frame = time.perf_counter()
+        self._after_id = self.widget.after(BG_FADE_FRAME_MS, self._step)
+
+    def _step(self) -> None:
+        now = time.perf_counter()
+        progress = (now - self._started) * 1000 / BG_FADE_MS
+        self.dropped += max(int((now - self._last_frame) * 1000 / BG_FADE_FRAME_MS) - 1, 0)
+        self._last_frame = now
+        if progress >= 1.0:
+            self.finish()
+            return
+        # The buffer holds start and end mixed at self._alpha; pasting the end
+        # through mask level m leaves (1 - alpha) * (1 - m) of the start.
+        level = round(255 * (1 - (1 - progress) / (1 - self._alpha)))
+        if level > 0:
+            self._mask.paste(level, (0, 0, *self._mask.size))
+            self._work.paste(self._end, (0, 0), self._mask)
+            self._photo.paste(self._work)
+            self._alpha = 1 - (1 - self._alpha) * (1 - level / 255)
+        cost_ms = (time.perf_counter() - now) * 1000
+        if self.metrics is not None and self.metrics.enabled:
+            self.metrics.record('fade_frame', cost_ms)
+        self._after_id = self.widget.after(max(int(BG_FADE_FRAME_MS - cost_ms), 1), self._step)
+
+    def finish(self) -> None:
+        """Skip to the end of a running fade."""
+        if self._after_id is None:
+            return
+        self.widget.after_cancel(self._after_id)
+        self._after_id = None
+        on_done, self._on_done = self._on_done, None
+        on_done()
+
+    def cancel(self) -> None:
+        """Stop a running fade, leaving its current frame on the canvas."""
+        if self._after_id is not None:
+            self.widget.after_cancel(self._after_id)
+            self._after_id = None
+        self._on_done = None
+
+
+class FramePlayer:
+    """Steps through animation frames on the Tk loop.
+
+    ``frame_at(index)`` returns ``(frame, duration_ms)`` or ``None`` while a
+    streamed frame is still being decoded, in which case the current frame
+    stays up and the player retries. ``show`` paints a frame. ``tick_due``
+    returns the ``perf_counter`` time of the next clock tick; a frame that
+    would land just before it waits until the tick has run instead.
+    """
+
+    def __init__(self, widget: tk.Misc, count: int, frame_at, show, tick_due, on_advance=None) -> None:
+        self.widget = widget
+        self.count = count
+        self.frame_at = frame_at
+        self.show = show
+        self.tick_due = tick_due
+        self.on_advance = on_advance
+        self.index = 0
+        self.stalls = 0
+        self._after_id = None
+
+    def start(self, first_duration_ms: int) -> None:
+        self._after_id = self.widget.after(first_duration_ms, self._step)
+
+    def stop(self) -> None:
+        if self._after_id is not None:
+            self.widget.after_cancel(self._after_id)
+            self._after_id = None
+
+    def _step(self) -> None:
+        now = time.perf_counter()
+        due = self.tick_due()
+        if due is not None and 0 <= due - now < BG_FRAME_TICK_GUARD_MS / 1000:
+            self._after_id = self.widget.after(int((due - now) * 1000) + 1, self._step)
+            return
+        index = (self.index + 1) % self.count
+        entry = self.frame_at(index)
+        if entry is None:
+            self.stalls += 1
+            self._after_id = self.widget.after(BG_POLL_MS, self._step)
+            return
+        frame, duration = entry
+        self.show(frame)
+        self.index = index
+        if self.on_advance is not None:
+            self.on_advance(index)
+        cost_ms = (time.perf_counter() - now) * 1000
+        self._after_id = self.widget.after(max(int(duration - cost_ms), 1), self._step)
+
+
+# ── State persistence ───────────────────────────────────────────────────────
+
+
+def app_runtime_dir() -> str:
+    """Folder holding the state file and caches: next to the exe when frozen."""
+    if getattr(sys, 'frozen', False):
+        return os.path.dirname(sys.executable)
+    return os.path.dirname(os.path.abspath(__file__))
+
+
+def write_json_atomic(path: str, data: dict) -> None:
+    """Write ``data`` to a temp file, fsync it, then rename it over ``path``."""
+    # One temp file per process: clocks sharing a state file never write
+    # into each other's half-finished copy.
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _is_color(value) -> bool:
+    if not isinstance(value, str) or len(value) != 7 or not value.startswith('#'):
+        return False
+    try:
+        int(value[1:], 16)
+    except ValueError:
+        return False
+    return True
+
+
+def _int_in(low: int, high: int):
+    return lambda v: isinstance(v, int) and not isinstance(v, bool) and low <= v <= high
+
+
+def _is_timestamp(value) -> bool:
+    return value is None or (isinstance(value, (int, float)) and not isinstance(value, bool) and value >= 0)
+
+
+# Field -> validator. Invalid or unknown values are skipped and keep their
+# defaults, so a hand-edited file can never leave the app half-configured.
+STATE_FIELDS = {
+    'custom_text': lambda v: isinstance(v, str),
+    'bg_path': lambda v: v is None or (isinstance(v, str) and os.path.exists(v)),
+    'bg_color': _is_color,
+    'bg_scale_percent': _int_in(20, 300),
+    'slideshow_source': lambda v: v is None or (isinstance(v, str) and os.path.exists(v)),
+    'slideshow_interval_s': _int_in(SLIDESHOW_MIN_INTERVAL_S, 86400),
+    'time_font_size': _int_in(24, 240),
+    'text_font_size': _int_in(12, 120),
+    'time_font_family': lambda v: isinstance(v, str) and bool(v),
+    'time_bold': lambda v: isinstance(v, bool),
+    'time_shadow': lambda v: isinstance(v, bool),
+    'text_font_family': lambda v: isinstance(v, str) and bool(v),
+    'text_bold': lambda v: isinstance(v, bool),
+    'text_color': _is_color,
+    'desc_color': _is_color,
+    'lang': lambda v: isinstance(v, str) and v in LANG_CATALOGS,
+    'is_fullscreen': lambda v: isinstance(v, bool),
+    'precise_ticks': lambda v: isinstance(v, bool),
+    'mmap_renditions': lambda v: isinstance(v, bool),
+    'glyph_time': lambda v: isinstance(v, bool),
+    'auto_fit': lambda v: isinstance(v, bool),
+    'mode': lambda v: isinstance(v, str) and v in ('clock', 'countup', 'countdown'),
+    'countdown_total': _int_in(0, 359999),
+    'count_start': _is_timestamp,
+    'paused': lambda v: isinstance(v, bool),
+    'pause_started_at': _is_timestamp,
+    'paused_duration': lambda v: isinstance(v, (int, float)) and not isinstance(v, bool) and v >= 0,
+    'clock_offset_seconds': _int_in(-86400, 86400),
+}
+
+
+# Defaults of the fields that shape a frame, shared by the app and the
+# headless renderer.
+SCENE_DEFAULTS = {
+    'custom_text': '全屏桌面时钟',
+    'text_color': '#FFFFFF',
+    'desc_color': '#9494b8',
+    'time_font_size': 120,
+    'text_font_size': 32,
+    'auto_fit': False,
+    'bg_path': None,
+    'bg_color': '#080811',
+    'bg_scale_percent': 100,
+    'time_font_family': 'Segoe UI',
+    'time_bold': False,
+    'time_shadow': True,
+    'text_font_family': 'Segoe UI',
+    'text_bold': False,
+    'lang': 'zh',
+}
+
+
+def _migrate_state_v1(data: dict) -> dict:
+    # V1.0 files carry no version and only the text/font fields; everything
+    # else simply falls back to defaults. Old builds accepted any '#...' color.
+    if not _is_color(data.get('desc_color')):
+        data.pop('desc_color', None)
+    return data
+
+
+STATE_MIGRATIONS = {
+    1: _migrate_state_v1,
+}
+
+
+def migrate_state(data: dict) -> dict:
+    """Upgrade a loaded state dict to ``STATE_SCHEMA_VERSION``."""
+    version = data.get('version', 1)
+    if not isinstance(version, int) or version < 1:
+        version = 1
+    while version < STATE_SCHEMA_VERSION:
+        data = STATE_MIGRATIONS[version](data)
+        version += 1
+    data['version'] = version
+    return data
+
+
+def state_value_ok(key: str, value) -> bool:
+    """Whether ``value`` is valid for ``key``; a validator that raises means no."""
+    try:
+        return bool(STATE_FIELDS[key](value))
+    except Exception:
+        return False
+
+
+def read_user_state(path: str) -> dict:
+    """Valid fields of the state file at ``path``; empty if it is missing or unreadable."""
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if not isinstance(data, dict):
+            raise ValueError('top-level value is not an object')
+        data = migrate_state(data)
+    except Exception as e:
+        print(f"[Full-Screen-Clock] WARNING: Failed to load user_state.json: {e}",
+              file=sys.__stdout__ if sys.__stdout__ else sys.stderr)
+        return {}
+    return {key: data[key] for key in STATE_FIELDS if key in data and state_value_ok(key, data[key])}
+
+
+class StateWriter:
+    """Persists JSON snapshots on a background thread; the latest one wins.
+
+    ``submit`` never blocks on disk. Snapshots handed in while a write is in
+    flight replace each other, so a burst collapses into one extra write.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._cond = threading.Condition()
+        self._pending: dict | None = None
+        self._busy = False
+        self._closed = False
+        self._thread = threading.Thread(target=self._loop, name='clock-state', daemon=True)
+        self._thread.start()
+
+    def submit(self, data: dict) -> None:
+        with self._cond:
+            self._pending = data
+            self._cond.notify_all()
+
+    def flush(self, timeout: float = STATE_FLUSH_TIMEOUT_S) -> bool:
+        with self._cond:
+            return self._cond.wait_for(lambda: self._pending is None and not self._busy, timeout)
+
+    def close(self, timeout: float = STATE_FLUSH_TIMEOUT_S) -> None:
+        self.flush(timeout)
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join(timeout)
+
+    def _loop(self) -> None:
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._pending is not None or self._closed)
+                if self._pending is None:
+                    return
+                data, self._pending = self._pending, None
+                self._busy = True
+            try:
+                write_json_atomic(self.path, data)
+            except Exception as e:
+                print(f"[Full-Screen-Clock] WARNING: Failed to save user_state.json: {e}",
+                      file=sys.__stdout__ if sys.__stdout__ else sys.stderr)
+            finally:
+                with self._cond:
+                    self._busy = False
+                    self._cond.notify_all()
+
+
+# ── Diagnostics ─────────────────────────────────────────────────────────────
+
+
+class CallbackStats:
+    def __init__(self) -> None:
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.recent: deque = deque(maxlen=METRICS_RECENT)
+
+    def add(self, elapsed_ms: float) -> None:
+        self.count += 1
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+        self.recent.append(elapsed_ms)
+
+    def percentile(self, pct: float) -> float:
+        if not self.recent:
+            return 0.0
+        ordered = sorted(self.recent)
+        return ordered[min(int(len(ordered) * pct / 100), len(ordered) - 1)]
+
+    def summary(self) -> dict:
+        return {
+            'count': self.count,
+            'avg_ms': round(self.total_ms / self.count, 3) if self.count else 0.0,
+            'p50_ms': round(self.percentile(50), 3),
+            'p95_ms': round(self.percentile(95), 3),
+            'max_ms': round(self.max_ms, 3),
+        }
+
+
+class Metrics:
+    """Per-callback timings and tick lateness, collected only while enabled."""
+
+    def __init__(self, enabled: bool = False) -> None:
+        self.enabled = enabled
+        self.callbacks: dict[str, CallbackStats] = {}
+        self.lateness = CallbackStats()
+        self.lateness_hist = [0] * (len(LATENESS_BUCKETS_MS) + 1)
+
+    def record(self, name: str, elapsed_ms: float) -> None:
+        stats = self.callbacks.get(name)
+        if stats is None:
+            stats = self.callbacks[name] = CallbackStats()
+        stats.add(elapsed_ms)
+
+    def record_lateness(self, late_ms: float) -> None:
+        self.lateness.add(late_ms)
+        for i, bound in enumerate(LATENESS_BUCKETS_MS):
+            if late_ms <= bound:
+                self.lateness_hist[i] += 1
+                return
+        self.lateness_hist[-1] += 1
+
+    def snapshot(self, counters: dict | None = None) -> dict:
+        labels = [f'<={b}ms' for b in LATENESS_BUCKETS_MS] + [f'>{LATENESS_BUCKETS_MS[-1]}ms']
+        return {
+            'callbacks': {name: stats.summary() for name, stats in sorted(self.callbacks.items())},
+            'tick_lateness': self.lateness.summary(),
+            'tick_lateness_histogram': dict(zip(labels, self.lateness_hist)),
+            'counters': counters or {},
+        }
+
+
+def instrumented(name: str):
+    """Time a FullscreenClockApp callback into ``self.metrics`` when enabled."""
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(self, *args, **kwargs):
+            if not self.metrics.enabled:
+                return fn(self, *args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return fn(self, *args, **kwargs)
+            finally:
+                self.metrics.record(name, (time.perf_counter() - start) * 1000)
+        return wrapper
+    return decorator
+
+
+# ── Translations ────────────────────────────────────────────────────────────
+
+LANG_DIRNAME = 'lang'
+LANG_DEFAULT_FALLBACK = ('en', 'zh')
+
+LANG_CATALOGS: dict[str, dict[str, str]] = {
+    'zh': {
+        'lang_name': '中文',
+        'app_title': f'全屏桌面时钟 {APP_VERSION}',
+        'version_text': f'版本: {APP_VERSION}',
+        'mode_prefix': '模式',
+        'mode_clock': '当前时间',
+        'mode_countup': '正计时',
+        'mode_countdown': '倒计时',
+        'state_running': '运行',
+        'state_paused': '暂停',
+        'state_done': '结束',
+        'help': '帮助',
+        'bg_image': '背景图',
+        'bg_color': '背景色',
+        'text': '文字',
+        'desc_color': '文字颜色',
+        'mode': '模式',
+        'set_time': '设时间',
+        'style': '样式',
+        'reset': '重置',
+        'pause_resume': '暂停/继续',
+        'fullscreen': '全屏',
+        'exit_fullscreen': '退出全屏',
+        'hide_bar': '隐藏栏',
+        'quit': '退出',
+        'style_title': '样式滑块',
+        'style_header': '字号 / 字体颜色(RGB) / 背景缩放',
+        'time_size': '时间字号',
+        'text_size': '文字字号',
+        'bg_scale': '背景缩放(%)',
+        'color_preview': '颜色预览',
+        'close': '关闭',
+        'time_font_label': '时间字体',
+        'time_bold_label': '粗体',
+        'time_shadow_label': '投影',
+        'auto_fit_label': '自动适配窗口',
+        'text_font_label': '描述文字字体',
+        'text_bold_label': '描述文字粗体',
+        'desc_color_label': '文字颜色',
+        'desc_color_pick': '选择',
+        'desc_color_reset': '还原',
+        'dialog_ok': '确定',
+        'dialog_cancel': '取消',
+        'dialog_countdown_prompt': '请输入倒计时秒数:',
+        'dialog_countup_prompt': '输入起始秒数:',
+        'dialog_set_time_prompt': '输入显示时间 (HH:MM:SS):',
+        'dialog_time_error': '格式错误',
+        'dialog_time_error_msg': '请使用 HH:MM:SS，例如 08:30:00',
+        'dialog_custom_text_prompt': '请输入要显示的文字（回车换行，Ctrl+回车确认）:',
+        'dialog_bg_error': '背景错误',
+        'dialog_bg_pillow_msg': '当前环境未安装 Pillow，仅支持 png/gif/ppm/pgm。\n请安装 Pillow 后使用 jpg/jpeg/bmp。',
+        'dialog_bg_load_fail': '加载背景失败',
+        'dialog_bg_invalid_size': '背景图片尺寸无效',
+        'dialog_bg_file_title': '选择背景图片',
+        'dialog_bg_color_title': '选择背景颜色',
+        'dialog_slideshow_title': '背景幻灯片',
+        'dialog_slideshow_interval_prompt': '每张图片显示秒数:',
+        'dialog_slideshow_empty': '没有找到可用的图片',
+        'help_title': '帮助',
+        'help_text': (
+            f'当前版本: {APP_VERSION}\n\n'
+            '底部按键可直接操作全部功能。\n\n'
+            '快捷键:\n'
+            'H 帮助\n'
+            'B 背景图片\n'
+            'C 背景颜色\n'
+            'P 背景幻灯片（选择文件夹）\n'
+            'N 下一张幻灯片\n'
+            'T 自定义文字（支持多行，回车换行）\n'
+            'L 文字颜色\n'
+            'F 打开样式滑块（字号/字体/颜色）\n'
+            'M 切换模式\n'
+            'R 重置计时\n'
+            'S 暂停/继续\n'
+            'I 性能指标叠加层\n'
+            'D 导出性能指标\n'
+            '底栏可点“隐藏栏”，隐藏后只保留箭头\n'
+            'Esc 退出全屏\n'
+            'Q 退出程序\n'
+        ),
+    },
+    'en': {
+        'lang_name': 'EN',
+        'app_title': f'Fullscreen Desktop Clock {APP_VERSION}',
+        'version_text': f'Version: {APP_VERSION}',
+        'mode_prefix': 'Mode',
+        'mode_clock': 'Clock',
+        'mode_countup': 'Count Up',
+        'mode_countdown': 'Count Down',
+        'state_running': 'Running',
+        'state_paused': 'Paused',
+        'state_done': 'Done',
+        'help': 'Help',
+        'bg_image': 'Image',
+        'bg_color': 'Color',
+        'text': 'Text',
+        'desc_color': 'Text Clr',
+        'mode': 'Mode',
+        'set_time': 'Set Time',
+        'style': 'Style',
+        'reset': 'Reset',
+        'pause_resume': 'Pause/Resume',
+        'fullscreen': 'Fullscreen',
+        'exit_fullscreen': 'Exit Fullscreen',
+        'hide_bar': 'Hide Bar',
+        'quit': 'Quit',
+        'style_title': 'Style Controls',
+        'style_header': 'Font Size / RGB Color / Background Scale',
+        'time_size': 'Time Size',
+        'text_size': 'Text Size',
+        'bg_scale': 'Background Scale (%)',
+        'color_preview': 'Color Preview',
+        'close': 'Close',
+        'time_font_label': 'Time Font',
+        'time_bold_label': 'Bold',
+        'time_shadow_label': 'Shadow',
+        'auto_fit_label': 'Fit to Window',
+        'text_font_label': 'Text Font',
+        'text_bold_label': 'Text Bold',
+        'desc_color_label': 'Text Color',
+        'desc_color_pick': 'Pick',
+        'desc_color_reset': 'Reset',
+        'dialog_ok': 'OK',
+        'dialog_cancel': 'Cancel',
+        'dialog_countdown_prompt': 'Enter countdown seconds:',
+        'dialog_countup_prompt': 'Enter starting seconds:',
+        'dialog_set_time_prompt': 'Enter display time (HH:MM:SS):',
+        'dialog_time_error': 'Format Error',
+        'dialog_time_error_msg': 'Please use HH:MM:SS, e.g. 08:30:00',
+        'dialog_custom_text_prompt': 'Enter text to display (Enter=newline, Ctrl+Enter=confirm):',
+        'dialog_bg_error': 'Background Error',
+        'dialog_bg_pillow_msg': 'Pillow is not installed. Only png/gif/ppm/pgm are supported.\nPlease install Pillow for jpg/jpeg/bmp support.',
+        'dialog_bg_load_fail': 'Failed to load background',
+        'dialog_bg_invalid_size': 'Invalid background image size',
+        'dialog_bg_file_title': 'Select Background Image',
+        'dialog_bg_color_title': 'Select Background Color',
+        'dialog_slideshow_title': 'Background Slideshow',
+        'dialog_slideshow_interval_prompt': 'Seconds per image:',
+        'dialog_slideshow_empty': 'No usable images found',
+        'help_title': 'Help',
+        'help_text': (
+            f'Current Version: {APP_VERSION}\n\n'
+            'Use the bottom toolbar for all features.\n\n'
+            'Shortcuts:\n'
+            'H Help\n'
+            'B Background Image\n'
+            'C Background Color\n'
+            'P Background Slideshow (pick a folder)\n'
+            'N Next Slide\n'
+            'T Custom Text (multi-line supported)\n'
+            'L Text Color\n'
+            'F Style Controls (font/weight/color)\n'
+            'M Switch Mode\n'
+            'R Reset Timer\n'
+            'S Pause/Resume\n'
+            'I Metrics Overlay\n'
+            'D Dump Metrics\n'
+            'Use "Hide Bar" to collapse toolbar to one arrow\n'
+            'Esc Exit Fullscreen\n'
+            'Q Quit\n'
+        ),
+    },
+}
+LANG_FALLBACKS: dict[str, tuple[str, ...]] = {}
+LANG_ORDER: list[str] = ['zh', 'en']
+
+# Mode/state captions shown every tick, derived once per language so the
+# tick path is a single dict lookup.
+_MODE_CAPTIONS = {
+    'mode_clock': ('mode_clock', None),
+    'mode_countup_running': ('mode_countup', 'state_running'),
+    'mode_countup_paused': ('mode_countup', 'state_paused'),
+    'mode_countdown_running': ('mode_countdown', 'state_running'),
+    'mode_countdown_paused': ('mode_countdown', 'state_paused'),
+    'mode_countdown_done': ('mode_countdown', 'state_done'),
+}
+MODE_LABEL_KEYS = {key: f'label_{key}' for key in _MODE_CAPTIONS}
+
+_resolved_catalogs: dict[str, dict[str, str]] = {}
+
+
+def register_language(code: str, strings: dict[str, str], *,
+                      fallback: tuple[str, ...] = LANG_DEFAULT_FALLBACK) -> None:
+    """Add or extend a language; keys it lacks fall back along ``fallback``."""
+    LANG_CATALOGS.setdefault(code, {}).update(strings)
+    LANG_FALLBACKS[code] = tuple(fallback)
+    if code not in LANG_ORDER:
+        LANG_ORDER.append(code)
+    _resolved_catalogs.clear()
+
+
+def load_language_files(directory: str) -> None:
+    """Register every ``<code>.json`` catalog found in ``directory``.
+
+    A catalog may name its fallback chain under ``"_fallback"``.
+    """
+    if not os.path.isdir(directory):
+        return
+    for name in sorted(os.listdir(directory)):
+        code, ext = os.path.splitext(name)
+        if ext.lower() != '.json':
+            continue
+        try:
+            with open(os.path.join(directory, name), 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            fallback = data.pop('_fallback', LANG_DEFAULT_FALLBACK)
+            if isinstance(fallback, str):
+                fallback = (fallback,)
+            strings = {k: v for k, v in data.items() if isinstance(k, str) and isinstance(v, str)}
+            register_language(code, strings, fallback=tuple(fallback))
+        except Exception as e:
+            print(f"[Full-Screen-Clock] WARNING: Failed to load language file {name}: {e}",
+                  file=sys.__stdout__ if sys.__stdout__ else sys.stderr)
+
+
+def language_catalog(code: str) -> dict[str, str]:
+    """Flattened catalog for ``code`` with its fallback chain merged in."""
+    resolved = _resolved_catalogs.get(code)
+    if resolved is not None:
+        return resolved
+    chain = [code, *LANG_FALLBACKS.get(code, LANG_DEFAULT_FALLBACK)]
+    resolved = {}
+    for lang in reversed(chain):
+        resolved.update(LANG_CATALOGS.get(lang, {}))
+    for key, (mode_key, state_key) in _MODE_CAPTIONS.items():
+        caption = resolved.get(mode_key, mode_key)
+        if state_key is not None:
+            caption = f"{caption} ({resolved.get(state_key, state_key)})"
+        resolved[key] = caption
+        resolved[MODE_LABEL_KEYS[key]] = f"{resolved.get('mode_prefix', 'mode_prefix')}: {caption}"
+    _resolved_catalogs[code] = resolved
+    return resolved
+
+
+# ── Text measurement ────────────────────────────────────────────────────────
+
+# Auto-fit budgets as fractions of the window. The time is centred at 0.42H
+# and the description at 0.56H; fitted blocks taller than that gap allows
+# are stacked around the midpoint instead (see scene_layout), so the two
+# budgets together must stay within the window.
+TIME_CENTER_Y = 0.42
+DESC_CENTER_Y = 0.56
+AUTO_FIT_WIDTH = 0.92
+AUTO_FIT_TIME_HEIGHT = 0.30
+AUTO_FIT_DESC_HEIGHT = 0.36
+TEXT_MEASURE_FONTS = 64
+TEXT_MEASURE_ENTRIES = 4096
+_DIGITS_RE = re.compile(r'\d')
+
+
+class TextMetrics:
+    """Memoised ``tkinter.font.Font`` measurements.
+
+    Widths are cached per (family, weight, size, shape) and line heights
+    per (family, weight, size). The shape maps every digit to '0', so all
+    times of one format share a single entry; UI fonts give digits equal
+    advances. Font objects are reused as well, since creating a Tk font
+    costs more than measuring with it.
+    """
+
+    def __init__(self, root: tk.Misc) -> None:
+        self.root = root
+        self._fonts: OrderedDict = OrderedDict()
+        self._entries: OrderedDict = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def _font(self, family: str, weight: str, size: int) -> tkfont.Font:
+        key = (family, weight, size)
+        font = self._fonts.get(key)
+        if font is None:
+            font = self._fonts[key] = tkfont.Font(root=self.root, family=family, size=size, weight=weight)
+            if len(self._fonts) > TEXT_MEASURE_FONTS:
+                self._fonts.popitem(last=False)
+        else:
+            self._fonts.move_to_end(key)
+        return font
+
+    def width(self, family: str, weight: str, size: int, text: str) -> int:
+        shape = _DIGITS_RE.sub('0', text)
+        return self._cached((family, weight, size, shape),
+                            lambda: self._font(family, weight, size).measure(shape))
+
+    def linespace(self, family: str, weight: str, size: int) -> int:
+        return self._cached((family, weight, size, None),
+                            lambda: self._font(family, weight, size).metrics('linespace'))
+
+    def _cached(self, key: tuple, compute) -> int:
+        value = self._entries.get(key)
+        if value is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return value
+        self.misses += 1
+        value = self._entries[key] = compute()
+        if len(self._entries) > TEXT_MEASURE_ENTRIES:
+            self._entries.popitem(last=False)
+        return value
+
+
+def scene_layout(width: int, height: int, time_size: int,
+                 blocks: tuple[int, int] | None = None) -> tuple[tuple[float, float], ...]:
+    """Centres of the time shadow, time and description text.
+
+    ``blocks`` holds the pixel heights of the time line and the description
+    block when auto-fit is on; if they would overlap at the usual centres
+    they are stacked, touching, around the midpoint between them.
+    """
+    shadow_offset = 3 + time_size * 0.008
+    time_y, desc_y = height * TIME_CENTER_Y, height * DESC_CENTER_Y
+    if blocks is not None:
+        time_h, desc_h = blocks
+        if (time_h + desc_h) / 2 > desc_y - time_y:
+            top = (time_y + desc_y) / 2 - (time_h + desc_h) / 2
+            time_y, desc_y = top + time_h / 2, top + time_h + desc_h / 2
+    return (
+        (width / 2 + shadow_offset, time_y + shadow_offset),
+        (width / 2, time_y),
+        (width / 2, desc_y),
+    )
+
+
+def scene_blocks(measure, scene, sizes: tuple[int, int]) -> tuple[int, int]:
+    """Heights of the time line and the description block at ``sizes``."""
+    time_weight = 'bold' if scene.time_bold else 'normal'
+    text_weight = 'bold' if scene.text_bold else 'normal'
+    lines = scene.custom_text.count('\n') + 1
+    return (measure.linespace(scene.time_font_family, time_weight, sizes[0]),
+            measure.linespace(scene.text_font_family, text_weight, sizes[1]) * lines)
+
+
+def fit_scene_fonts(measure, scene, width: int, height: int) -> tuple[int, int]:
+    """Auto-fit time and description sizes for ``scene`` in a window.
+
+    ``measure`` is a ``TextMetrics`` or anything with the same ``width`` and
+    ``linespace`` methods; the configured sizes are the upper bounds.
+    """
+    max_width = width * AUTO_FIT_WIDTH
+    time_family = scene.time_font_family
+    time_weight = 'bold' if scene.time_bold else 'normal'
+    text_family = scene.text_font_family
+    text_weight = 'bold' if scene.text_bold else 'normal'
+    lines = scene.custom_text.split('\n')
+
+    def time_fits(size: int) -> bool:
+        return (measure.width(time_family, time_weight, size, '00:00:00') <= max_width
+                and measure.linespace(time_family, time_weight, size) <= height * AUTO_FIT_TIME_HEIGHT)
+
+    def desc_fits(size: int) -> bool:
+        block = measure.linespace(text_family, text_weight, size) * len(lines)
+        return (block <= height * AUTO_FIT_DESC_HEIGHT
+                and all(measure.width(text_family, text_weight, size, line) <= max_width
+                        for line in lines))
+
+    return (fit_font_size(time_fits, 24, scene.time_font_size),
+            fit_font_size(desc_fits, 12, scene.text_font_size))
+
+
+def fit_font_size(fits, low: int, high: int) -> int:
+    """Largest size in ``[low, high]`` for which ``fits(size)`` holds, else ``low``."""
+    best = low
+    while low <= high:
+        mid = (low + high) // 2
+        if fits(mid):
+            best, low = mid, mid + 1
+        else:
+            high = mid - 1
+    return best
+
+
+# ── Glyph atlas ─────────────────────────────────────────────────────────────
+
+GLYPH_CHARS = '0123456789:'
+GLYPH_ATLAS_CACHE = 4
+
+
+@functools.lru_cache(maxsize=32)
+def find_font_file(family: str, bold: bool, *, substitute: bool = False) -> str | None:
+    """Locate the font file for ``family``; None when it cannot be found.
+
+    fontconfig always answers with its closest match; that file is only
+    returned when ``substitute`` is set or it really is ``family``.
+    """
+    if sys.platform == 'win32':
+        import winreg
+
+        wanted = (f'{family} Bold' if bold else family).lower()
+        fonts_dir = os.path.join(os.environ.get('WINDIR', r'C:\Windows'), 'Fonts')
+        subkey = r'SOFTWARE\Microsoft\Windows NT\CurrentVersion\Fonts'
+        for hive in (winreg.HKEY_LOCAL_MACHINE, winreg.HKEY_CURRENT_USER):
+            try:
+                with winreg.OpenKey(hive, subkey) as key:
+                    for index in range(winreg.QueryInfoKey(key)[1]):
+                        name, value, _ = winreg.EnumValue(key, index)
+                        # e.g. 'Segoe UI Bold (TrueType)' -> 'segoeuib.ttf'
+                        if name.rsplit(' (', 1)[0].lower() == wanted:
+                            return os.path.join(fonts_dir, value)
+            except OSError:
+                continue
+        return None
+    import subprocess
+
+    pattern = f'{family}:bold' if bold else family
+    try:
+        found = subprocess.run(['fc-match', '-f', '%{family}\n%{file}', pattern],
+                               capture_output=True, text=True, timeout=2).stdout
+    except (OSError, subprocess.SubprocessError):
+        return None
+    names, _, found = found.partition('\n')
+    # e.g. 'DejaVu Sans,DejaVu Sans Condensed' for a font with several names.
+    if not substitute and family.lower() not in {name.strip().lower() for name in names.split(',')}:
+        return None
+    return found if os.path.isfile(found) else None
+
+
+class GlyphAtlas:
+    """Digits and ':' rendered once for one font, size, colour and shadow.
+
+    Digits share one cell width (the widest digit) so the layout of a time
+    string never moves while it counts; the shadow is baked into each glyph.
+    """
+
+    def __init__(self, font_file: str, pixel_size: int, color: str, shadow_offset: float) -> None:
+        from PIL import ImageDraw, ImageFont
+
+        font = ImageFont.truetype(font_file, pixel_size)
+        ascent, descent = font.getmetrics()
+        pad = math.ceil(shadow_offset)
+        self.height = ascent + descent + pad
+        digit_width = max(math.ceil(font.getlength(ch)) for ch in '0123456789')
+        self.widths: dict[str, int] = {}
+        self.images: dict[str, object] = {}
+        for ch in GLYPH_CHARS:
+            advance = font.getlength(ch)
+            width = digit_width if ch.isdigit() else math.ceil(advance)
+            img = Image.new('RGBA', (width + pad, self.height), (0, 0, 0, 0))
+            draw = ImageDraw.Draw(img)
+            x = (width - advance) / 2
+            if shadow_offset:
+                draw.text((x + shadow_offset, shadow_offset), ch, font=font, fill='#000000')
+            draw.text((x, 0), ch, font=font, fill=color)
+            self.widths[ch] = width
+            self.images[ch] = ImageTk.PhotoImage(img)
+
+
+class TimeGlyphs:
+    """Shows a time string as one canvas image item per character.
+
+    Only items whose character changed are retargeted, so a clock tick
+    usually touches one or two glyphs instead of re-rasterising the whole
+    string. Atlases are kept for the last few font/colour combinations.
+    Font files are looked up on a worker thread, since fc-match can take
+    far longer than a tick.
+    """
+
+    def __init__(self, canvas: tk.Canvas) -> None:
+        self.canvas = canvas
+        self.items: list[int] = []
+        self.chars: list[str] = []
+        self.center = (0.0, 0.0)
+        self.atlas = None
+        self._atlases: OrderedDict = OrderedDict()
+        self._placed = None
+        self._font_files: dict[tuple[str, bool], object] = {}  # (family, bold) -> Future
+        self._resolver = ThreadPoolExecutor(max_workers=1, thread_name_prefix='clock-font')
+
+    def font_file(self, family: str, bold: bool) -> str | None:
+        """The font file for ``family``, or None while it is being looked up or is missing."""
+        lookup = self._font_files.get((family, bold))
+        if lookup is None:
+            lookup = self._font_files[family, bold] = self._resolver.submit(find_font_file, family, bold)
+        return lookup.result() if lookup.done() else None
+
+    def close(self) -> None:
+        self._resolver.shutdown(wait=False, cancel_futures=True)
+
+    def use(self, key: tuple) -> None:
+        atlas = self._atlases.get(key)
+        if atlas is None:
+            atlas = self._atlases[key] = GlyphAtlas(*key)
+            while len(self._atlases) > GLYPH_ATLAS_CACHE:
+                self._atlases.popitem(last=False)
+        self._atlases.move_to_end(key)
+        if atlas is not self.atlas:
+            self.atlas = atlas
+            self._placed = None  # widths and images both change
+
+    def place(self, x: float, y: float) -> None:
+        self.center = (x, y)
+        self._placed = None
+
+    def render(self, text: str) -> None:
+        atlas = self.atlas
+        layout = (tuple(ch == ':' for ch in text), self.center, id(atlas))
+        if layout != self._placed:
+            self._layout(text)
+            self._placed = layout
+        for i, ch in enumerate(text):
+            if ch != self.chars[i]:
+                self.canvas.itemconfigure(self.items[i], image=atlas.images[ch])
+                self.chars[i] = ch
+
+    def _layout(self, text: str) -> None:
+        atlas = self.atlas
+        while len(self.items) < len(text):
+            self.items.append(self.canvas.create_image(0, 0, anchor='nw', tags='glyph'))
+        while len(self.items) > len(text):
+            self.canvas.delete(self.items.pop())
+        total = sum(atlas.widths[ch] for ch in text)
+        x = self.center[0] - total / 2
+        y = self.center[1] - atlas.height / 2
+        for item, ch in zip(self.items, text):
+            self.canvas.coords(item, round(x), round(y))
+            x += atlas.widths[ch]
+        self.chars = [''] * len(text)
+
+    def clear(self) -> None:
+        for item in self.items:
+            self.canvas.delete(item)
+        self.items = []
+        self.chars = []
+        self._placed = None
+
+
+# ── Headless rendering ──────────────────────────────────────────────────────
+
+# Tk sizes fonts in points; headless frames assume a 96 DPI display.
+HEADLESS_DPI = 96
+HEADLESS_DEFAULT_SIZE = (1920, 1080)
+HEADLESS_PNG_COMPRESS = 1
+FRAME_SIZE_RE = re.compile(r'^(\d+)x(\d+)$')
+# Used when the configured font has no glyphs for a caption (the default
+# texts are Chinese); the first one installed wins.
+CJK_FONT_FILES = ('msyh.ttc', 'simhei.ttf', 'simsun.ttc', 'NotoSansCJK-Regular.ttc',
+                  'NotoSansCJKsc-Regular.otf', 'NotoSansSC-Regular.otf',
+                  'SourceHanSansSC-Regular.otf', 'wqy-microhei.ttc', 'wqy-zenhei.ttc',
+                  'PingFang.ttc', 'STHeiti Medium.ttc')
+
+
+def format_hms(total_seconds: int) -> str:
+    total_seconds = max(total_seconds, 0)
+    total_seconds = min(total_seconds, 359999)  # cap at 99:59:59
+    h = total_seconds // 3600
+    m = (total_seconds % 3600) // 60
+    s = total_seconds % 60
+    return f'{h:02d}:{m:02d}:{s:02d}'
+
+
+def parse_hms(value: str) -> int:
+    """Seconds from ``HH:MM:SS``, ``MM:SS`` or a plain number of seconds."""
+    try:
+        parts = [int(part) for part in value.split(':')]
+    except ValueError:
+        parts = []
+    if (not 1 <= len(parts) <= 3 or any(part < 0 for part in parts)
+            or any(part > 59 for part in parts[1:])):
+        raise argparse.ArgumentTypeError(f'invalid time {value!r}, expected HH:MM:SS')
+    seconds = 0
+    for part in parts:
+        seconds = seconds * 60 + part
+    if seconds > 359999:
+        raise argparse.ArgumentTypeError(f'{value!r} is past 99:59:59')
+    return seconds
+
+
+def parse_frame_size(value: str) -> tuple[int, int]:
+    match = FRAME_SIZE_RE.match(value.strip())
+    if not match or 0 in (int(match[1]), int(match[2])):
+        raise argparse.ArgumentTypeError(f'invalid frame size {value!r}, expected WxH')
+    return int(match[1]), int(match[2])
+
+
+def _points_to_pixels(points: int) -> int:
+    return max(round(points * HEADLESS_DPI / 72), 1)
+
+
+@functools.lru_cache(maxsize=64)
+def load_scene_font(family: str, bold: bool, pixel_size: int):
+    """Pillow font for a Tk font spec; Pillow's own font if the file is missing."""
+    from PIL import ImageFont
+
+    # Tk substitutes missing families too, so a stand-in beats Pillow's font.
+    font_file = find_font_file(family, bold, substitute=True)
+    if font_file is not None:
+        try:
+            return ImageFont.truetype(font_file, pixel_size)
+        except OSError:
+            pass
+    return ImageFont.load_default(pixel_size)
+
+
+def _font_dirs() -> list[str]:
+    home = os.path.expanduser('~')
+    if sys.platform == 'win32':
+        return [os.path.join(os.environ.get('WINDIR', r'C:\Windows'), 'Fonts'),
+                os.path.join(os.environ.get('LOCALAPPDATA', home), 'Microsoft', 'Windows', 'Fonts')]
+    if sys.platform == 'darwin':
+        return ['/System/Library/Fonts', '/Library/Fonts', os.path.join(home, 'Library', 'Fonts')]
+    return ['/usr/share/fonts', '/usr/local/share/fonts',
+            os.path.join(home, '.local', 'share', 'fonts'), os.path.join(home, '.fonts')]
+
+
+@functools.lru_cache(maxsize=1)
+def find_cjk_font_file() -> str | None:
+    """The first of ``CJK_FONT_FILES`` that is installed, or None."""
+    wanted = {name.lower(): rank for rank, name in enumerate(CJK_FONT_FILES)}
+    best = None
+    for root in _font_dirs():
+        for dirpath, _dirs, names in os.walk(root):
+            for name in names:
+                rank = wanted.get(name.lower())
+                if rank is not None and (best is None or rank < best[0]):
+                    best = (rank, os.path.join(dirpath, name))
+    return best[1] if best else None
+
+
+def _lacks_glyphs(font, text: str) -> bool:
+    """True if any visible character of ``text`` renders as the font's .notdef box."""
+    missing = font.getmask('\U0010FFFF')
+    notdef = (missing.size, bytes(missing))
+    for ch in set(text):
+        if not ch.isspace():
+            mask = font.getmask(ch)
+            if (mask.size, bytes(mask)) == notdef:
+                return True
+    return False
+
+
+@functools.lru_cache(maxsize=64)
+def load_text_font(family: str, bold: bool, pixel_size: int, text: str):
+    """``load_scene_font``, or an installed CJK font if that one cannot draw ``text``."""
+    from PIL import ImageFont
+
+    font = load_scene_font(family, bold, pixel_size)
+    if _lacks_glyphs(font, text):
+        cjk_file = find_cjk_font_file()
+        if cjk_file is not None:
+            try:
+                return ImageFont.truetype(cjk_file, pixel_size)
+            except OSError:
+                pass
+    return font
+
+
+class PillowTextMetrics:
+    """``TextMetrics`` counterpart that measures with Pillow fonts."""
+
+    def width(self, family: str, weight: str, size: int, text: str) -> int:
+        font = load_text_font(family, weight == 'bold', _points_to_pixels(size), text)
+        return math.ceil(font.getlength(text))
+
+    def linespace(self, family: str, weight: str, size: int) -> int:
+        ascent, descent = load_scene_font(family, weight == 'bold', _points_to_pixels(size)).getmetrics()
+        return ascent + descent
+
+
+class HeadlessClock:
+    """Composes clock frames with Pillow alone, no Tk window needed.
+
+    The scene matches ``FullscreenClockApp``: the background scaled by
+    ``bg_scale_percent`` and centred on ``bg_color``, the time and its
+    shadow, ``custom_text`` and the status line. Everything except the time
+    is drawn once into a base image; each frame restores only the area the
+    previous time covered and draws the new time into one reused buffer.
+    """
+
+    def __init__(self, size: tuple[int, int], state: dict | None = None) -> None:
+        from PIL import ImageDraw
+
+        self.size = size
+        self.scene = scene = types.SimpleNamespace(**{**SCENE_DEFAULTS, **(state or {})})
+        width, height = size
+        time_size, text_size = scene.time_font_size, scene.text_font_size
+        blocks = None
+        if scene.auto_fit:
+            measure = PillowTextMetrics()
+            time_size, text_size = fit_scene_fonts(measure, scene, width, height)
+            blocks = scene_blocks(measure, scene, (time_size, text_size))
+        shadow_pos, self.time_pos, desc_pos = scene_layout(width, height, time_size, blocks)
+        self.shadow_pos = shadow_pos if scene.time_shadow else None
+        self.time_font = load_scene_font(scene.time_font_family, scene.time_bold,
+                                         _points_to_pixels(time_size))
+
+        self.base = Image.new('RGB', size)
+        _compose_frame(self.base, self._background(), scene.bg_color)
+        draw = ImageDraw.Draw(self.base)
+        if scene.custom_text:
+            desc_font = load_text_font(scene.text_font_family, scene.text_bold,
+                                       _points_to_pixels(text_size), scene.custom_text)
+            draw.multiline_text(desc_pos, scene.custom_text, fill=scene.desc_color,
+                                font=desc_font, anchor='mm')
+        status_text = language_catalog(scene.lang)['version_text']
+        status_font = load_text_font(STATUS_FONT[0], False, _points_to_pixels(STATUS_FONT[1]),
+                                     status_text)
+        draw.text(STATUS_POS, status_text, fill=STATUS_COLOR, font=status_font, anchor='la')
+        self.frame = self.base.copy()
+        self._draw = ImageDraw.Draw(self.frame)
+        self._dirty = None
+
+    def _background(self):
+        scene = self.scene
+        if not scene.bg_path:
+            return None
+        width, height = self.size
+        try:
+            pyramid = BackgroundPyramid(*decode_background(scene.bg_path, width, height,
+                                                           scene.bg_scale_percent))
+        except Exception as exc:
+            print(f'[Full-Screen-Clock] WARNING: Failed to load background {scene.bg_path}: {exc}',
+                  file=sys.stderr)
+            return None
+        return BackgroundRenderer._resample(pyramid, width, height, scene.bg_scale_percent)
+
+    def render(self, time_text: str):
+        """Draw ``time_text`` and return the frame; the next call reuses the buffer."""
+        draw, font = self._draw, self.time_font
+        if self._dirty is not None:
+            self.frame.paste(self.base.crop(self._dirty), self._dirty)
+        boxes = [draw.textbbox(self.time_pos, time_text, font=font, anchor='mm')]
+        if self.shadow_pos is not None:
+            boxes.append(draw.textbbox(self.shadow_pos, time_text, font=font, anchor='mm'))
+            draw.text(self.shadow_pos, time_text, fill='#000000', font=font, anchor='mm')
+        draw.text(self.time_pos, time_text, fill=self.scene.text_color, font=font, anchor='mm')
+        # One pixel of slack covers anti-aliasing at fractional positions.
+        width, height = self.size
+        self._dirty = (max(math.floor(min(b[0] for b in boxes)) - 1, 0),
+                       max(math.floor(min(b[1] for b in boxes)) - 1, 0),
+                       min(math.ceil(max(b[2] for b in boxes)) + 1, width),
+                       min(math.ceil(max(b[3] for b in boxes)) + 1, height))
+        return self.frame
+
+
+def render_frames(clock: HeadlessClock, start: int, stop: int, output: str) -> int:
+    """Render one frame per second from ``start`` to ``stop``, both included.
+
+    Counts down when ``stop`` is before ``start``. ``output`` is a folder for
+    numbered PNGs, or '-' to stream raw RGB frames to stdout. Returns the
+    number of frames written.
+    """
+    step = 1 if stop >= start else -1
+    stream = sys.stdout.buffer if output == '-' else None
+    if stream is None:
+        os.makedirs(output, exist_ok=True)
+    count = 0
+    for seconds in range(start, stop + step, step):
+        frame = clock.render(format_hms(seconds))
+        if stream is not None:
+            stream.write(frame.tobytes())
+        else:
+            frame.save(os.path.join(output, f'frame_{count:06d}.png'),
+                       compress_level=HEADLESS_PNG_COMPRESS)
+        count += 1
+    if stream is not None:
+        stream.flush()
+    return count
+
+
+def run_headless(args: argparse.Namespace) -> int:
+    if not load_pillow():
+        print('[Full-Screen-Clock] Pillow is required for --render', file=sys.stderr)
+        return 2
+    runtime = app_runtime_dir()
+    load_language_files(os.path.join(runtime, LANG_DIRNAME))
+    state = read_user_state(args.state or os.path.join(runtime, CONFIG_FILENAME))
+    started = time.perf_counter()
+    clock = HeadlessClock(args.size, state)
+    stop = args.time_from if args.time_to is None else args.time_to
+    count = render_frames(clock, args.time_from, stop, args.render)
+    width, height = args.size
+    print(f'[Full-Screen-Clock] rendered {count} frames at {width}x{height} '
+          f'in {time.perf_counter() - started:.2f} s', file=sys.stderr)
+    return 0
+
+
+# ── Remote viewing ──────────────────────────────────────────────────────────
+
+HTTP_DEFAULT_HOST = '127.0.0.1'
+HTTP_HEADER_LIMIT = 8192
+HTTP_HEADER_TIMEOUT_S = 10
+HTTP_JPEG_QUALITY = 80
+MJPEG_BOUNDARY = 'clockframe'
+ASYNC_CLOSE_TIMEOUT_S = 1.0
+HTTP_INDEX_PAGE = (b'<!doctype html><title>Full-Screen-Clock</title>'
+                   b'<body style="margin:0;background:#000">'
+                   b'<img src="/stream.mjpg" style="width:100%">')
+
+
+def parse_listen_address(value: str) -> tuple[str, int]:
+    """``PORT`` or ``HOST:PORT``; the host defaults to loopback."""
+    host, _, port = value.rpartition(':')
+    try:
+        number = int(port)
+    except ValueError:
+        number = 0
+    if not 0 < number < 65536:
+        raise argparse.ArgumentTypeError(f'invalid address {value!r}, expected [HOST:]PORT')
+    return host.strip('[]') or HTTP_DEFAULT_HOST, number
+
+
+def load_asyncio():
+    """Import asyncio on first call and return it."""
+    global asyncio
+    if asyncio is None:
+        import asyncio
+    return asyncio
+
+
+class AsyncService:
+    """An asyncio loop on a daemon thread, for servers that live beside Tk.
+
+    Subclasses open their servers in ``_start`` and append them to
+    ``_servers``; ``close`` shuts those down and cancels open connections.
+    """
+
+    thread_name = 'clock-async'
+
+    def __init__(self) -> None:
+        load_asyncio()
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name=self.thread_name, daemon=True)
+        self._servers: list = []
+
+    def start(self) -> None:
+        """Start the loop and bind; raises OSError if an address is unavailable."""
+        self._thread.start()
+        asyncio.run_coroutine_threadsafe(self._start(), self._loop).result()
+
+    async def _start(self) -> None:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        if not self._thread.is_alive():
+            return
+
+        async def _stop() -> None:
+            for server in self._servers:
+                server.close()
+            for task in asyncio.all_tasks():
+                if task is not asyncio.current_task():
+                    task.cancel()
+
+        try:
+            asyncio.run_coroutine_threadsafe(_stop(), self._loop).result(ASYNC_CLOSE_TIMEOUT_S)
+        except Exception:
+            pass
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(ASYNC_CLOSE_TIMEOUT_S)
+
+
+class FrameServer(AsyncService):
+    """Serves the clock frame over HTTP from an asyncio loop on its own thread.
+
+    ``/frame.png`` and ``/frame.jpg`` return the current frame and
+    ``/stream.mjpg`` pushes one JPEG per displayed second. The Tk loop only
+    ``publish``es the time and scene; frames are composed by a
+    ``HeadlessClock`` and encoded at most once per format and second, on
+    first request, and that one buffer goes to every viewer.
+    """
+
+    thread_name = 'clock-http'
+
+    def __init__(self, host: str, port: int) -> None:
+        super().__init__()
+        self.address = (host, port)
+        self.viewers = 0
+        self.encodes = 0
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='clock-http-encode')
+        self._changed = None  # asyncio.Event, replaced on every new frame
+        self._encode_lock = None
+        self._published = None  # last key handed over by publish (Tk thread)
+        self._frame_key = None  # (size, scene items, time text) on the loop
+        self._encoded: dict[str, bytes] = {}
+        self._clock = None  # HeadlessClock; only touched by the encoder
+        self._clock_key = None
+
+    async def _start(self) -> None:
+        self._changed = asyncio.Event()
+        self._encode_lock = asyncio.Lock()
+        self._servers.append(await asyncio.start_server(self._handle, *self.address,
+                                                        limit=HTTP_HEADER_LIMIT))
+
+    def close(self) -> None:
+        super().close()
+        self._executor.shutdown(wait=False)
+
+    def publish(self, size: tuple[int, int], scene: dict, time_text: str) -> None:
+        """Hand over what the window shows now; repeats of the last frame are dropped."""
+        key = (size, tuple(scene.items()), time_text)
+        if key != self._published:
+            self._published = key
+            self._loop.call_soon_threadsafe(self._set_frame, key)
+
+    def _set_frame(self, key: tuple) -> None:
+        self._frame_key = key
+        self._encoded.clear()
+        changed, self._changed = self._changed, asyncio.Event()
+        changed.set()
+
+    async def frame(self, fmt: str) -> bytes | None:
+        """The current frame as 'png' or 'jpg'; None until one is published."""
+        async with self._encode_lock:
+            data = self._encoded.get(fmt)
+            key = self._frame_key
+            if data is None and key is not None:
+                data = await self._loop.run_in_executor(self._executor, self._encode, key, fmt)
+                if data is not None and key is self._frame_key:
+                    self._encoded[fmt] = data
+        return data
+
+    def _encode(self, key: tuple, fmt: str) -> bytes | None:
+        if not load_pillow():
+            return None
+        size, scene, time_text = key
+        if (size, scene) != self._clock_key:
+            self._clock = HeadlessClock(size, dict(scene))
+            self._clock_key = (size, scene)
+        frame = self._clock.render(time_text)
+        out = io.BytesIO()
+        if fmt == 'png':
+            frame.save(out, 'PNG', compress_level=HEADLESS_PNG_COMPRESS)
+        else:
+            frame.save(out, 'JPEG', quality=HTTP_JPEG_QUALITY)
+        self.encodes += 1
+        return out.getvalue()
+
+    async def _handle(self, reader: 'asyncio.StreamReader', writer: 'asyncio.StreamWriter') -> None:
+        try:
+            head = await asyncio.wait_for(reader.readuntil(b'\r\n\r\n'), HTTP_HEADER_TIMEOUT_S)
+            method, target, *_ = head.split(b'\r\n', 1)[0].decode('latin-1').split(' ')
+            path = target.split('?', 1)[0]
+            head_only = method == 'HEAD'
+            if method not in ('GET', 'HEAD'):
+                await self._respond(writer, '405 Method Not Allowed', 'text/plain', b'GET only\n')
+            elif path == '/stream.mjpg':
+                await self._stream(writer, head_only=head_only)
+            elif path in ('/frame.png', '/frame.jpg'):
+                fmt = path.rsplit('.', 1)[1]
+                # HEAD takes the length from an encode already done and never
+                # pays for one just to report it.
+                data = self._encoded.get(fmt) if head_only else await self.frame(fmt)
+                if data is None and (not head_only or self._frame_key is None):
+                    await self._respond(writer, '503 Service Unavailable', 'text/plain',
+                                        b'no frame yet\n', head_only=head_only)
+                else:
+                    content_type = 'image/png' if fmt == 'png' else 'image/jpeg'
+                    await self._respond(writer, '200 OK', content_type, data, head_only=head_only)
+            elif path == '/':
+                await self._respond(writer, '200 OK', 'text/html; charset=utf-8', HTTP_INDEX_PAGE,
+                                    head_only=head_only)
+            else:
+                await self._respond(writer, '404 Not Found', 'text/plain', b'not found\n',
+                                    head_only=head_only)
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, asyncio.TimeoutError,
+                ConnectionError, ValueError, asyncio.CancelledError):
+            pass  # malformed request, the viewer went away or the server is closing
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def _respond(writer: 'asyncio.StreamWriter', status: str, content_type: str,
+                       body: bytes | None, *, head_only: bool = False) -> None:
+        # A HEAD answer may have no body at hand; it then omits the length.
+        length = '' if body is None else f'Content-Length: {len(body)}\r\n'
+        writer.write((f'HTTP/1.1 {status}\r\nContent-Type: {content_type}\r\n'
+                      f'{length}Cache-Control: no-store\r\n'
+                      f'Connection: close\r\n\r\n').encode('latin-1'))
+        if not head_only and body is not None:
+            writer.write(body)
+        await writer.drain()
+
+    async def _stream(self, writer: 'asyncio.StreamWriter', *, head_only: bool = False) -> None:
+        writer.write((f'HTTP/1.1 200 OK\r\nContent-Type: multipart/x-mixed-replace; '
+                      f'boundary={MJPEG_BOUNDARY}\r\nCache-Control: no-store\r\n'
+                      f'Connection: close\r\n\r\n').encode('latin-1'))
+        if head_only:
+            await writer.drain()
+            return
+        self.viewers += 1
+        try:
+            while True:
+                # Take the event first so a frame published mid-encode is not missed.
+                changed = self._changed
+                data = await self.frame('jpg')
+                if data is not None:
+                    writer.write(f'--{MJPEG_BOUNDARY}\r\nContent-Type: image/jpeg\r\n'
+                                 f'Content-Length: {len(data)}\r\n\r\n'.encode('latin-1'))
+                    writer.write(data)
+                    writer.write(b'\r\n')
+                    await writer.drain()
+                await changed.wait()
+        finally:
+            self.viewers -= 1
+
+
+# ── Control API ─────────────────────────────────────────────────────────────
+
+# Default socket name; one per process, so several instances can run.
+CONTROL_SOCKET_NAME = 'control-{pid}.sock'
+CONTROL_LINE_LIMIT = 64 * 1024
+# Commands applied per tick at most; the rest wait for the next tick.
+CONTROL_BATCH_MAX = 1000
+CONTROL_STYLE_KEYS = FONT_STYLE_KEYS | {'custom_text', 'text_color', 'desc_color', 'bg_scale_percent'}
+CONTROL_TK_IMAGE_EXTENSIONS = frozenset({'.png', '.gif', '.ppm', '.pgm'})
+
+
+def _control_seconds(args: dict, low: int) -> int:
+    seconds = args.get('seconds')
+    if not _int_in(low, 359999)(seconds):
+        raise ValueError(f'seconds must be an integer from {low} to 359999')
+    return seconds
+
+
+def parse_control_command(message) -> tuple[str, dict]:
+    """Validate one control message; returns ``(command, arguments)``.
+
+    Raises ``ValueError`` with a message meant for the client. Validation
+    runs on the server thread, so a bad command never reaches Tk.
+    """
+    if not isinstance(message, dict) or not isinstance(message.get('cmd'), str):
+        raise ValueError('expected an object with a "cmd" string')
+    name = message['cmd']
+    if name == 'set_mode':
+        mode = message.get('mode')
+        if mode not in ('clock', 'countup', 'countdown'):
+            raise ValueError('mode must be clock, countup or countdown')
+        args = {'mode': mode}
+        if mode == 'countdown':
+            args['seconds'] = _control_seconds(message, 1)
+        return name, args
+    if name == 'set_time_value':
+        value = message.get('value')
+        if isinstance(value, str):
+            return name, {'value': value}
+        return name, {'value': _control_seconds({'seconds': value}, 0)}
+    if name in ('reset_mode_timer', 'toggle_pause', 'get_state'):
+        return name, {}
+    if name == 'set':
+        properties = message.get('properties')
+        if not isinstance(properties, dict) or not properties:
+            raise ValueError('"properties" must be a non-empty object')
+        for key, value in properties.items():
+            if key not in CONTROL_STYLE_KEYS:
+                raise ValueError(f'unknown property {key!r}')
+            if not state_value_ok(key, value):
+                raise ValueError(f'invalid value for {key!r}')
+        return name, {'properties': properties}
+    if name == 'set_background':
+        path, color = message.get('path'), message.get('color')
+        if color is not None and not _is_color(color):
+            raise ValueError('color must look like #RRGGBB')
+        if path is not None:
+            if not isinstance(path, str) or not os.path.isfile(path):
+                raise ValueError('path must name an existing image file')
+            if (os.path.splitext(path)[1].lower() not in CONTROL_TK_IMAGE_EXTENSIONS
+                    and not load_pillow()):
+                raise ValueError('this image format needs Pillow')
+        elif color is None and 'path' not in message:
+            raise ValueError('expected "path" and/or "color"')
+        return name, {'path': path, 'color': color}
+    raise ValueError(f'unknown command {name!r}')
+
+
+def take_commands(commands: queue.Queue, limit: int = CONTROL_BATCH_MAX) -> list[tuple]:
+    """Up to ``limit`` queued ``(name, args, future)`` commands, oldest first."""
+    batch = []
+    while len(batch) < limit:
+        try:
+            batch.append(commands.get_nowait())
+        except queue.Empty:
+            break
+    return batch
+
+
+def _remove_stale_socket(path: str) -> None:
+    """Delete a socket left behind by a crashed run; refuse anything else."""
+    try:
+        mode = os.stat(path).st_mode
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(mode):
+        raise OSError(f'{path} exists and is not a socket')
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(path)
+    except ConnectionRefusedError:
+        os.unlink(path)  # nobody is listening any more
+        return
+    finally:
+        probe.close()
+    raise OSError(f'{path} is in use by another instance')
+
+
+class ControlServer(AsyncService):
+    """JSON control API on a Unix socket and/or a loopback TCP port.
+
+    Clients send one JSON object per line, e.g. ``{"cmd": "set_mode",
+    "mode": "countdown", "seconds": 300, "id": 1}``, and get one reply line
+    per command, in order: ``{"id": 1, "ok": true}`` or ``"ok": false``
+    with an ``"error"``. Commands are validated here and put on
+    ``commands``; the Tk loop takes them in batches once per tick (see
+    ``take_commands``) and resolves each reply, so clients may pipeline as
+    many lines as they like.
+    """
+
+    thread_name = 'clock-control'
+
+    def __init__(self, socket_path: str | None = None, port: int | None = None,
+                 commands: queue.Queue | None = None) -> None:
+        super().__init__()
+        self.socket_path = socket_path
+        self.port = port
+        self.commands = commands if commands is not None else queue.Queue()
+        self.handled = 0
+        self._owns_socket = False
+
+    async def _start(self) -> None:
+        if self.socket_path is not None:
+            if not hasattr(asyncio, 'start_unix_server'):
+                raise OSError('Unix sockets are not available on this platform')
+            _remove_stale_socket(self.socket_path)
+            server = await asyncio.start_unix_server(self._handle, self.socket_path,
+                                                     limit=CONTROL_LINE_LIMIT)
+            self._owns_socket = True
+            os.chmod(self.socket_path, 0o600)
+            self._servers.append(server)
+        if self.port is not None:
+            self._servers.append(await asyncio.start_server(self._handle, '127.0.0.1', self.port,
+                                                            limit=CONTROL_LINE_LIMIT))
+
+    def close(self) -> None:
+        super().close()
+        if self._owns_socket:
+            self._owns_socket = False
+            try:
+                os.unlink(self.socket_path)
+            except OSError:
+                pass
+
+    def resolve(self, future: 'asyncio.Future', result=None, error: Exception | None = None) -> None:
+        """Complete a command's reply; safe to call from any thread."""
+        self.handled += 1
+        self._loop.call_soon_threadsafe(self._settle, future, result, error)
+
+    @staticmethod
+    def _settle(future: 'asyncio.Future', result, error: Exception | None) -> None:
+        if future.done():
+            return  # the client went away
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+    async def _handle(self, reader: 'asyncio.StreamReader', writer: 'asyncio.StreamWriter') -> None:
+        replies: asyncio.Queue = asyncio.Queue()
+        sender = asyncio.ensure_future(self._send_replies(replies, writer))
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                future = self._loop.create_future()
+                request_id = None
+                try:
+                    message = json.loads(line)
+                    if isinstance(message, dict):
+                        request_id = message.get('id')
+                    name, args = parse_control_command(message)
+                except ValueError as e:  # includes JSONDecodeError
+                    future.set_exception(e)
+                else:
+                    self.commands.put((name, args, future))
+                replies.put_nowait((request_id, future))
+        except (asyncio.LimitOverrunError, ValueError, ConnectionError):
+            pass  # line too long or the client went away
+        except asyncio.CancelledError:
+            # The server is closing; ending normally keeps asyncio quiet.
+            sender.cancel()
+            writer.close()
+            return
+        replies.put_nowait(None)
+        try:
+            await sender
+        except asyncio.CancelledError:
+            pass
+        writer.close()
+
+    @staticmethod
+    async def _send_replies(replies: 'asyncio.Queue', writer: 'asyncio.StreamWriter') -> None:
+        while True:
+            item = await replies.get()
+            if item is None:
+                return
+            request_id, future = item
+            try:
+                reply = {'id': request_id, 'ok': True}
+                result = await future
+                if result is not None:
+                    reply['result'] = result
+            except Exception as e:
+                reply = {'id': request_id, 'ok': False, 'error': str(e)}
+            try:
+                writer.write(json.dumps(reply, ensure_ascii=False).encode('utf-8') + b'\n')
+                await writer.drain()
+            except ConnectionError:
+                return
+
+
+# ── Instance sync ───────────────────────────────────────────────────────────
+
+# Administratively scoped group; TTL 0 keeps the datagrams on this host.
+SYNC_GROUP = '239.255.73.42'
+SYNC_DEFAULT_PORT = 47342
+SYNC_LOOPBACK = '127.0.0.1'
+SYNC_PROTOCOL = 1
+# A follower switches to another leader once its own has been quiet this long.
+SYNC_LEADER_TIMEOUT_S = 3.0
+SYNC_FIELDS = ('mode', 'count_start', 'countdown_total', 'paused', 'pause_started_at',
+               'paused_duration', 'clock_offset_seconds')
+
+
+class SyncService(AsyncService):
+    """Keeps clock processes on one host ticking together over UDP multicast.
+
+    The leader sends its timer anchors (``SYNC_FIELDS``) every tick. The
+    anchors are wall-clock timestamps, so a follower that adopts them shows
+    the same count and flips on the same second boundary; received anchors
+    go through the control command queue and are applied at the next tick.
+    Followers stick to one leader and only switch after it goes quiet.
+    """
+
+    thread_name = 'clock-sync'
+
+    def __init__(self, role: str, port: int, commands: queue.Queue) -> None:
+        super().__init__()
+        self.role = role
+        self.port = port
+        self.commands = commands
+        self.sent = 0
+        self.received = 0
+        self._transport = None
+        self._leader = None  # (pid, last seq, monotonic time heard)
+        self._seq = 0
+
+    async def _start(self) -> None:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
+        try:
+            loopback = socket.inet_aton(SYNC_LOOPBACK)
+            if self.role == 'leader':
+                sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_TTL, 0)
+                sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_LOOP, 1)
+                sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_IF, loopback)
+            else:
+                # Every follower binds the same port. Binding the group
+                # address filters out unicast datagrams; Windows does not
+                # allow it, so there only the sender check applies.
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+                if hasattr(socket, 'SO_REUSEPORT'):
+                    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+                sock.bind(('' if sys.platform == 'win32' else SYNC_GROUP, self.port))
+                sock.setsockopt(socket.IPPROTO_IP, socket.IP_ADD_MEMBERSHIP,
+                                struct.pack('4s4s', socket.inet_aton(SYNC_GROUP), loopback))
+            sock.setblocking(False)
+        except OSError:
+            sock.close()
+            raise
+        service = self
+
+        class _SyncProtocol(asyncio.DatagramProtocol):
+            def datagram_received(self, data: bytes, addr) -> None:
+                # Leaders send from the loopback interface; anything else came
+                # from another machine and must not steer the clock.
+                if addr[0] == SYNC_LOOPBACK:
+                    service._received(data)
+
+        self._transport, _ = await self._loop.create_datagram_endpoint(_SyncProtocol, sock=sock)
+        self._servers.append(self._transport)
+
+    def broadcast(self, state: dict) -> None:
+        """Send the leader's anchors; callable from the Tk thread."""
+        self._seq += 1
+        data = json.dumps({'v': SYNC_PROTOCOL, 'pid': os.getpid(), 'seq': self._seq,
+                           'state': state}).encode('utf-8')
+        self._loop.call_soon_threadsafe(self._send, data)
+
+    def _send(self, data: bytes) -> None:
+        if self._transport is not None and not self._transport.is_closing():
+            self._transport.sendto(data, (SYNC_GROUP, self.port))
+            self.sent += 1
+
+    def _received(self, data: bytes) -> None:
+        try:
+            message = json.loads(data)
+            pid, seq, state = message['pid'], message['seq'], message['state']
+            if message['v'] != SYNC_PROTOCOL or not all(
+                    state_value_ok(key, state[key]) for key in SYNC_FIELDS):
+                return
+        except (ValueError, KeyError, TypeError):
+            return  # not one of ours
+        now = time.monotonic()
+        leader = self._leader
+        if leader is not None and leader[0] != pid and now - leader[2] < SYNC_LEADER_TIMEOUT_S:
+            return  # another leader is already being followed
+        if leader is not None and leader[0] == pid and seq <= leader[1]:
+            return  # stale or duplicated datagram
+        self._leader = (pid, seq, now)
+        self.received += 1
+        self.commands.put(('sync', {key: state[key] for key in SYNC_FIELDS}, None))
+
+
+# ── Extra displays ──────────────────────────────────────────────────────────
+
+
+def parse_display_geometries(spec: str) -> list[str]:
+    """Split ``'1920x1080+0+0,1920x1080+1920+0'`` into validated geometries."""
+    geometries = []
+    for part in spec.split(','):
+        part = part.strip()
+        if not part:
+            continue
+        if not DISPLAY_GEOMETRY_RE.match(part):
+            raise ValueError(f'invalid display geometry: {part!r} (expected WxH+X+Y)')
+        geometries.append(part)
+    return geometries
+
+
+class ClockDisplay:
+    """A borderless clock window on an additional monitor.
+
+    It has its own canvas and layout but no toolbar; the owning app drives
+    its text from the single tick loop and feeds it backgrounds from the
+    shared renderer, so every display reuses the same decoded source.
+    """
+
+    def __init__(self, app: 'FullscreenClockApp', geometry: str, target: str) -> None:
+        self.app = app
+        self.target = target
+        self.window = tk.Toplevel(app.root)
+        self.window.overrideredirect(True)
+        self.window.geometry(geometry)
+        self.window.configure(bg=app.bg_color)
+        self.canvas = tk.Canvas(self.window, bg=app.bg_color, highlightthickness=0, bd=0)
+        self.canvas.pack(fill='both', expand=True)
+
+        time_font = app._time_font()
+        self.time_shadow_item = self.canvas.create_text(
+            0, 0, text='00:00:00', fill='#000000', font=time_font, anchor='center',
+            state='normal' if app.time_shadow else 'hidden',
+        )
+        self.time_item = self.canvas.create_text(
+            0, 0, text='00:00:00', fill=app.text_color, font=time_font, anchor='center',
+        )
+        self.desc_item = self.canvas.create_text(
+            0, 0, text=app.custom_text, fill=app.desc_color, font=app._desc_font(), anchor='center',
+        )
+        self.bg_photo = None
+        self._last_time_key = None
+        self._last_desc_key = None
+        self._last_size = (0, 0)
+        self._resize_after_id = None
+
+        self.window.bind('<Configure>', self._on_configure)
+        self.window.bind('q', lambda _: app.quit_app())
+        self.window.bind('Q', lambda _: app.quit_app())
+        self.window.protocol('WM_DELETE_WINDOW', app.quit_app)
+
+    def size(self) -> tuple[int, int]:
+        return max(self.window.winfo_width(), 1), max(self.window.winfo_height(), 1)
+
+    def _on_configure(self, _event=None) -> None:
+        new_size = self.size()
+        if new_size == self._last_size or min(new_size) <= 1:
+            return
+        first_layout = self._last_size == (0, 0)
+        self._last_size = new_size
+        if self._resize_after_id is not None:
+            self.window.after_cancel(self._resize_after_id)
+            self._resize_after_id = None
+        if first_layout:
+            self._flush_resize()
+        else:
+            self._resize_after_id = self.window.after(DISPLAY_RESIZE_DEBOUNCE_MS, self._flush_resize)
+
+    def _flush_resize(self) -> None:
+        self._resize_after_id = None
+        self.position()
+        self.app.request_display_background(self)
+
+    def position(self) -> None:
+        shadow, time_pos, desc = self.app.text_layout(*self.size())
+        self.canvas.coords(self.time_shadow_item, *shadow)
+        self.canvas.coords(self.time_item, *time_pos)
+        self.canvas.coords(self.desc_item, *desc)
+
+    def apply_fonts(self, time_font: tuple, desc_font: tuple, shadow_state: str) -> None:
+        self.canvas.itemconfigure(self.time_shadow_item, font=time_font, state=shadow_state)
+        self.canvas.itemconfigure(self.time_item, font=time_font)
+        self.canvas.itemconfigure(self.desc_item, font=desc_font)
+
+    def render(self, display_time: str) -> None:
+        app = self.app
+        time_key = (display_time, app.text_color)
+        if time_key != self._last_time_key:
+            self.canvas.itemconfigure(self.time_item, text=display_time, fill=app.text_color)
+            self.canvas.itemconfigure(self.time_shadow_item, text=display_time)
+            self._last_time_key = time_key
+        desc_key = (app.custom_text, app.desc_color)
+        if desc_key != self._last_desc_key:
+            self.canvas.itemconfigure(self.desc_item, text=app.custom_text, fill=app.desc_color)
+            self._last_desc_key = desc_key
+
+    def show_photo(self, photo, centered: bool = False) -> None:
+        width, height = self.size()
+        if centered:
+            self.canvas.delete('bg')
+            self.canvas.create_image(width / 2, height / 2, image=photo, anchor='center', tags='bg')
+            self.canvas.tag_lower('bg')
+        else:
+            place_background_item(self.canvas, photo, width, height)
+        self.bg_photo = photo
+
+    def clear_background(self) -> None:
+        self.canvas.configure(bg=self.app.bg_color)
+        self.canvas.delete('bg')
+        self.bg_photo = None
+
+
 class FullscreenClockApp:
-    def __init__(self, root: tk.Tk) -> None:
+    def __init__(self, root: tk.Tk, *, profiler: StartupProfiler | None = None,
+                 show_help_on_start: bool = False, metrics: bool = False,
+                 metrics_dump: str | None = None,
+                 displays: list[str] | None = None, slideshow: str | None = None,
+                 slideshow_interval: int | None = None,
+                 serve: tuple[str, int] | None = None, control_socket: str | None = None,
+                 control_port: int | None = None, sync: str | None = None,
+                 sync_port: int = SYNC_DEFAULT_PORT, precise_ticks: bool | None = None,
+                 mmap_renditions: bool | None = None, glyph_time: bool | None = None) -> None:
         self.root = root
-        self.lang = 'zh'
-        self.root.title(self.app_title())
-        self.root.geometry('1280x720')
+        self.profiler = profiler or StartupProfiler()
+        self.metrics = Metrics(metrics)
+        self._metrics_after_id = None
+        self._metrics_were_enabled = self.metrics.enabled
+        # Where D writes metrics; None means a timestamped JSON file.
+        self.metrics_dump_path = metrics_dump
+        self.show_help_on_start = show_help_on_start
+        self.lang = SCENE_DEFAULTS['lang']
+        load_language_files(os.path.join(self.runtime_dir(), LANG_DIRNAME))
+        self.root.geometry(displays[0] if displays else '1280x720')
         self.root.minsize(900, 560)
-        self.root.attributes('-fullscreen', False)
         self.is_fullscreen = False
         self.root.configure(bg='#080811')
 
@@ -292,25 +2820,83 @@ class FullscreenClockApp:
         self.pause_started_at = None
         self.paused_duration = 0
         self.clock_offset_seconds = 0
-
-        self.custom_text = '全屏桌面时钟'
-        self.text_color = '#FFFFFF'
-        self.desc_color = '#9494b8'
-        self.time_font_size = 120
-        self.text_font_size = 32
-
-        self.bg_path = None
-        self.bg_color = '#080811'
+        # Precise ticks wake shortly before each second boundary and then
+        # again right on it, trading one extra wakeup for Tk timer jitter.
+        self.precise_ticks = False
+        # Store disk renditions as raw pixels that are memory-mapped on load.
+        self.mmap_renditions = False
+        # Draw the time from a pre-rendered digit atlas instead of text items.
+        self.glyph_time = False
+        self._glyphs = None
+        self._glyphs_active = False
+        self._pixels_per_point = None
+        self._tick_after_id = None
+        self._tick_due = None
+
+        self.custom_text = SCENE_DEFAULTS['custom_text']
+        self.text_color = SCENE_DEFAULTS['text_color']
+        self.desc_color = SCENE_DEFAULTS['desc_color']
+        self.time_font_size = SCENE_DEFAULTS['time_font_size']
+        self.text_font_size = SCENE_DEFAULTS['text_font_size']
+        # Auto-fit treats the configured sizes as maxima and shrinks them to
+        # the window; _fitted_sizes holds the sizes in use, if any.
+        self.auto_fit = SCENE_DEFAULTS['auto_fit']
+        self._fitted_sizes = None
+        self.text_metrics = TextMetrics(root)
+
+        self.bg_path = SCENE_DEFAULTS['bg_path']
+        self.bg_color = SCENE_DEFAULTS['bg_color']
         self.bg_photo = None
-        self.bg_scale_percent = 100
-        self._bg_pil_image = None
-        self._bg_pil_path = None
-        self.time_font_family = 'Segoe UI'
-        self.time_bold = False
-        self.time_shadow = True
-        self.text_font_family = 'Segoe UI'
-        self.text_bold = False
+        self.bg_scale_percent = SCENE_DEFAULTS['bg_scale_percent']
+        self._bg_renderer = None
+        self._bg_jobs: dict[str, int] = {}
+        self._bg_poll_id = None
+        self._bg_preview_id = None
+        self._bg_refine_id = None
+        self._bg_fade = None
+        self._bg_image = None  # Pillow image currently shown in the main window
+        self._bg_image_path = None
+        self._awaiting_first_background = True
+        self._bg_player = None
+        self._bg_animation = None  # (key, frame_count, streamed) waiting to play or playing
+        self._bg_stream_pending = False
+        self._tk_frames: list = []
+        self._tk_frames_after_id = None
+        self._first_paint_done = False
+        # Slideshow: the source (folder or playlist) and interval persist;
+        # prefetch jobs render upcoming slides per target ahead of time and
+        # the next slide's PhotoImage is built early so the swap is cheap.
+        self.slideshow_source = None
+        self.slideshow_interval_s = SLIDESHOW_DEFAULT_INTERVAL_S
+        self.slideshow_paths: list[str] = []
+        self.slideshow_index = 0
+        self._slideshow_after_id = None
+        self._slide_failed: set[str] = set()
+        self._slide_prefetch: dict[str, tuple[str, str]] = {}
+        self._slide_ready: dict[str, tuple[tuple, object, object]] = {}
+        self._slide_prefetch_key = None
+        self.time_font_family = SCENE_DEFAULTS['time_font_family']
+        self.time_bold = SCENE_DEFAULTS['time_bold']
+        self.time_shadow = SCENE_DEFAULTS['time_shadow']
+        self.text_font_family = SCENE_DEFAULTS['text_font_family']
+        self.text_bold = SCENE_DEFAULTS['text_bold']
+        self._state_dirty = False
+        self._save_after_id = None
         self.load_user_state()
+        if slideshow is not None:
+            self.slideshow_source = slideshow
+        if slideshow_interval is not None:
+            self.slideshow_interval_s = max(slideshow_interval, SLIDESHOW_MIN_INTERVAL_S)
+        if precise_ticks is not None:
+            self.precise_ticks = precise_ticks
+        if mmap_renditions is not None:
+            self.mmap_renditions = mmap_renditions
+        if glyph_time is not None:
+            self.glyph_time = glyph_time
+        self._state_writer = StateWriter(self.state_path())
+        self.root.title(self.app_title())
+        self.root.attributes('-fullscreen', self.is_fullscreen)
+        self.profiler.mark('state_loaded')
 
         self.style_panel = None
         self.time_size_scale = None
@@ -320,6 +2906,7 @@ class FullscreenClockApp:
         self.g_scale = None
         self.b_scale = None
         self._style_swatch = None
+        self._style_after_id = None
         self.toolbar_visible = True
         self._toolbar_anim_id = None
         self.mode_label = None
@@ -330,7 +2917,7 @@ class FullscreenClockApp:
         self._toolbar_buttons: list[tk.Button] = []
         self._last_size = (0, 0)
 
-        self.canvas = tk.Canvas(self.root, highlightthickness=0, bd=0)
+        self.canvas = tk.Canvas(self.root, bg=self.bg_color, highlightthickness=0, bd=0)
         self.canvas.pack(fill='both', expand=True)
 
         time_font = self._time_font()
@@ -361,13 +2948,21 @@ class FullscreenClockApp:
             anchor='center',
         )
         self.status_item = self.canvas.create_text(
-            28,
-            24,
+            *STATUS_POS,
             text=self.version_text(),
-            fill='#5a5a7a',
-            font=('Segoe UI', 13),
+            fill=STATUS_COLOR,
+            font=STATUS_FONT,
             anchor='nw',
         )
+        self.metrics_item = self.canvas.create_text(
+            28,
+            52,
+            text='',
+            fill='#7a7a9a',
+            font=('Consolas', 10),
+            anchor='nw',
+            state='hidden',
+        )
 
         # Frosted-glass toolbar: translucent-like border + dark inner panel.
         self.controls_container = tk.Frame(
@@ -403,170 +2998,93 @@ class FullscreenClockApp:
             cursor='hand2',
         )
         self.build_controls()
+        self._update_fullscreen_btn()
+
+        # The main window covers the first display; each further geometry
+        # gets a toolbar-less mirror window driven by the same tick loop.
+        self.displays = [
+            ClockDisplay(self, geometry, f'display{i}')
+            for i, geometry in enumerate((displays or [])[1:], start=1)
+        ]
+
+        # Opt-in HTTP view of the clock for remote monitoring.
+        self.frame_server = None
+        if serve is not None:
+            self.frame_server = self._start_frame_server(*serve)
+        # Scripted control and sync updates share one queue, applied at the
+        # start of each tick.
+        self.commands: queue.Queue = queue.Queue()
+        self.control_server = None
+        if control_socket is not None or control_port is not None:
+            self.control_server = self._start_control_server(control_socket, control_port)
+        self.sync = None
+        if sync is not None:
+            self.sync = self._start_sync(sync, sync_port)
 
         self.bind_hotkeys()
+        # The window's close button and Alt+F4 must flush state and stop the
+        # servers just like Q does.
+        self.root.protocol('WM_DELETE_WINDOW', self.quit_app)
         self.root.bind('<Configure>', self.on_resize)
         self.root.bind('<Escape>', lambda _: self.toggle_fullscreen() if self.is_fullscreen else None)
 
-        self.redraw_background()
-        self.apply_time_font()
+        # The background is drawn after the first <Configure>, once the real
+        # window size is known, instead of once here at 1x1 and again later.
         self.update_ui()
+        self.profiler.mark('widgets_built')
+
+    def _start_frame_server(self, host: str, port: int) -> FrameServer | None:
+        server = FrameServer(host, port)
+        try:
+            server.start()
+        except OSError as e:
+            print(f"[Full-Screen-Clock] WARNING: Cannot serve frames on {host}:{port}: {e}",
+                  file=sys.__stdout__ if sys.__stdout__ else sys.stderr)
+            server.close()
+            return None
+        return server
+
+    def _start_control_server(self, socket_path: str | None, port: int | None) -> ControlServer | None:
+        server = ControlServer(socket_path, port, self.commands)
+        out = sys.__stdout__ if sys.__stdout__ else sys.stderr
+        try:
+            server.start()
+        except OSError as e:
+            print(f"[Full-Screen-Clock] WARNING: Cannot start the control API: {e}", file=out)
+            server.close()
+            return None
+        if socket_path is not None:
+            print(f"[Full-Screen-Clock] control API on {socket_path}", file=out)
+        return server
+
+    def _start_sync(self, role: str, port: int) -> SyncService | None:
+        service = SyncService(role, port, self.commands)
+        try:
+            service.start()
+        except OSError as e:
+            print(f"[Full-Screen-Clock] WARNING: Cannot start {role} sync on port {port}: {e}",
+                  file=sys.__stdout__ if sys.__stdout__ else sys.stderr)
+            service.close()
+            return None
+        return service
+
+    def scene_snapshot(self) -> dict:
+        """Fields that shape a frame, as a ``HeadlessClock`` state dict."""
+        return {key: getattr(self, key) for key in SCENE_DEFAULTS}
 
     def app_title(self) -> str:
-        if self.lang == 'en':
-            return f'Fullscreen Desktop Clock {APP_VERSION}'
-        return f'全屏桌面时钟 {APP_VERSION}'
+        return self.t('app_title')
 
     def version_text(self) -> str:
-        if self.lang == 'en':
-            return f'Version: {APP_VERSION}'
-        return f'版本: {APP_VERSION}'
+        return self.t('version_text')
 
     def t(self, key: str) -> str:
-        zh = {
-            'mode_prefix': '模式',
-            'mode_clock': '当前时间',
-            'mode_countup': '正计时',
-            'mode_countdown': '倒计时',
-            'state_running': '运行',
-            'state_paused': '暂停',
-            'state_done': '结束',
-            'help': '帮助',
-            'bg_image': '背景图',
-            'bg_color': '背景色',
-            'text': '文字',
-            'desc_color': '文字颜色',
-            'mode': '模式',
-            'set_time': '设时间',
-            'style': '样式',
-            'reset': '重置',
-            'pause_resume': '暂停/继续',
-            'fullscreen': '全屏',
-            'exit_fullscreen': '退出全屏',
-            'hide_bar': '隐藏栏',
-            'quit': '退出',
-            'lang_switch': 'EN',
-            'style_title': '样式滑块',
-            'style_header': '字号 / 字体颜色(RGB) / 背景缩放',
-            'time_size': '时间字号',
-            'text_size': '文字字号',
-            'bg_scale': '背景缩放(%)',
-            'color_preview': '颜色预览',
-            'close': '关闭',
-            'time_font_label': '时间字体',
-            'time_bold_label': '粗体',
-            'time_shadow_label': '投影',
-            'text_font_label': '描述文字字体',
-            'text_bold_label': '描述文字粗体',
-            'desc_color_label': '文字颜色',
-            'desc_color_pick': '选择',
-            'desc_color_reset': '还原',
-            'dialog_ok': '确定',
-            'dialog_cancel': '取消',
-            'dialog_countdown_prompt': '请输入倒计时秒数:',
-            'dialog_countup_prompt': '输入起始秒数:',
-            'dialog_set_time_prompt': '输入显示时间 (HH:MM:SS):',
-            'dialog_time_error': '格式错误',
-            'dialog_time_error_msg': '请使用 HH:MM:SS，例如 08:30:00',
-            'dialog_custom_text_prompt': '请输入要显示的文字（回车换行，Ctrl+回车确认）:',
-            'dialog_bg_error': '背景错误',
-            'dialog_bg_pillow_msg': '当前环境未安装 Pillow，仅支持 png/gif/ppm/pgm。\n请安装 Pillow 后使用 jpg/jpeg/bmp。',
-            'dialog_bg_load_fail': '加载背景失败',
-            'dialog_bg_invalid_size': '背景图片尺寸无效',
-            'dialog_bg_file_title': '选择背景图片',
-            'dialog_bg_color_title': '选择背景颜色',
-            'help_title': '帮助',
-            'help_text': (
-                f'当前版本: {APP_VERSION}\n\n'
-                '底部按键可直接操作全部功能。\n\n'
-                '快捷键:\n'
-                'H 帮助\n'
-                'B 背景图片\n'
-                'C 背景颜色\n'
-                'T 自定义文字（支持多行，回车换行）\n'
-                'L 文字颜色\n'
-                'F 打开样式滑块（字号/字体/颜色）\n'
-                'M 切换模式\n'
-                'R 重置计时\n'
-                'S 暂停/继续\n'
-                '底栏可点“隐藏栏”，隐藏后只保留箭头\n'
-                'Esc 退出全屏\n'
-                'Q 退出程序\n'
-            ),
-        }
-        en = {
-            'mode_prefix': 'Mode',
-            'mode_clock': 'Clock',
-            'mode_countup': 'Count Up',
-            'mode_countdown': 'Count Down',
-            'state_running': 'Running',
-            'state_paused': 'Paused',
-            'state_done': 'Done',
-            'help': 'Help',
-            'bg_image': 'Image',
-            'bg_color': 'Color',
-            'text': 'Text',
-            'desc_color': 'Text Clr',
-            'mode': 'Mode',
-            'set_time': 'Set Time',
-            'style': 'Style',
-            'reset': 'Reset',
-            'pause_resume': 'Pause/Resume',
-            'fullscreen': 'Fullscreen',
-            'exit_fullscreen': 'Exit Fullscreen',
-            'hide_bar': 'Hide Bar',
-            'quit': 'Quit',
-            'lang_switch': '中文',
-            'style_title': 'Style Controls',
-            'style_header': 'Font Size / RGB Color / Background Scale',
-            'time_size': 'Time Size',
-            'text_size': 'Text Size',
-            'bg_scale': 'Background Scale (%)',
-            'color_preview': 'Color Preview',
-            'close': 'Close',
-            'time_font_label': 'Time Font',
-            'time_bold_label': 'Bold',
-            'time_shadow_label': 'Shadow',
-            'text_font_label': 'Text Font',
-            'text_bold_label': 'Text Bold',
-            'desc_color_label': 'Text Color',
-            'desc_color_pick': 'Pick',
-            'desc_color_reset': 'Reset',
-            'dialog_ok': 'OK',
-            'dialog_cancel': 'Cancel',
-            'dialog_countdown_prompt': 'Enter countdown seconds:',
-            'dialog_countup_prompt': 'Enter starting seconds:',
-            'dialog_set_time_prompt': 'Enter display time (HH:MM:SS):',
-            'dialog_time_error': 'Format Error',
-            'dialog_time_error_msg': 'Please use HH:MM:SS, e.g. 08:30:00',
-            'dialog_custom_text_prompt': 'Enter text to display (Enter=newline, Ctrl+Enter=confirm):',
-            'dialog_bg_error': 'Background Error',
-            'dialog_bg_pillow_msg': 'Pillow is not installed. Only png/gif/ppm/pgm are supported.\nPlease install Pillow for jpg/jpeg/bmp support.',
-            'dialog_bg_load_fail': 'Failed to load background',
-            'dialog_bg_invalid_size': 'Invalid background image size',
-            'dialog_bg_file_title': 'Select Background Image',
-            'dialog_bg_color_title': 'Select Background Color',
-            'help_title': 'Help',
-            'help_text': (
-                f'Current Version: {APP_VERSION}\n\n'
-                'Use the bottom toolbar for all features.\n\n'
-                'Shortcuts:\n'
-                'H Help\n'
-                'B Background Image\n'
-                'C Background Color\n'
-                'T Custom Text (multi-line supported)\n'
-                'L Text Color\n'
-                'F Style Controls (font/weight/color)\n'
-                'M Switch Mode\n'
-                'R Reset Timer\n'
-                'S Pause/Resume\n'
-                'Use "Hide Bar" to collapse toolbar to one arrow\n'
-                'Esc Exit Fullscreen\n'
-                'Q Quit\n'
-            ),
-        }
-        table = en if self.lang == 'en' else zh
-        return table[key]
+        return language_catalog(self.lang).get(key, key)
+
+    def next_language(self) -> str:
+        if self.lang not in LANG_ORDER:
+            return LANG_ORDER[0]
+        return LANG_ORDER[(LANG_ORDER.index(self.lang) + 1) % len(LANG_ORDER)]
 
     def build_controls(self) -> None:
         for widget in self.controls.winfo_children():
@@ -574,7 +3092,7 @@ class FullscreenClockApp:
 
         self.mode_label = tk.Label(
             self.controls,
-            text=f"{self.t('mode_prefix')}: {self.t('mode_clock')}",
+            text=self.t('label_mode_clock'),
             font=('Segoe UI', 10, 'bold'),
             fg='#d8d8f0',
             bg='#14141e',
@@ -596,7 +3114,7 @@ class FullscreenClockApp:
             (self.t('pause_resume'), self.toggle_pause),
             (self.t('fullscreen'), self.toggle_fullscreen),
             (self.t('hide_bar'), lambda: self.set_toolbar_visible(False)),
-            (self.t('lang_switch'), self.toggle_language),
+            (language_catalog(self.next_language())['lang_name'], self.toggle_language),
             (self.t('quit'), self.quit_app),
         ]
         self._toolbar_buttons.clear()
@@ -620,7 +3138,7 @@ class FullscreenClockApp:
             self._toolbar_buttons.append(btn)
 
     def toggle_language(self) -> None:
-        self.lang = 'en' if self.lang == 'zh' else 'zh'
+        self.lang = self.next_language()
         self.root.title(self.app_title())
         self._last_status_key = None
         self._last_mode_label_text = None
@@ -635,14 +3153,19 @@ class FullscreenClockApp:
         for btn, key in zip(self._toolbar_buttons, toolbar_keys):
             if key == 'fullscreen':
                 continue  # handled by _update_fullscreen_btn
+            if key == 'lang_switch':
+                btn.configure(text=language_catalog(self.next_language())['lang_name'])
+                continue
             btn.configure(text=self.t(key))
         self._update_fullscreen_btn()
 
         if self.mode_label is not None:
-            _, mode_text = self.get_display_time()
-            mode_label_text = f"{self.t('mode_prefix')}: {mode_text}"
+            _, mode_key = self.display_state()
+            mode_label_text = self.t(MODE_LABEL_KEYS[mode_key])
             self.mode_label.configure(text=mode_label_text)
             self._last_mode_label_text = mode_label_text
+        self.request_tick()
+        self.save_user_state()
 
     def set_toolbar_visible(self, visible: bool) -> None:
         self.toolbar_visible = visible
@@ -655,6 +3178,7 @@ class FullscreenClockApp:
         else:
             self._animate_toolbar_out(0)
 
+    @instrumented('toolbar_anim_in')
     def _animate_toolbar_in(self, step: int) -> None:
         total_steps = 10
         if step == 0:
@@ -670,6 +3194,7 @@ class FullscreenClockApp:
             self.controls_container.place(relx=0.5, rely=1.0, anchor='s', y=-16)
             self._toolbar_target_y = -16
 
+    @instrumented('toolbar_anim_out')
     def _animate_toolbar_out(self, step: int) -> None:
         total_steps = 10
         if step == 0:
@@ -715,9 +3240,100 @@ class FullscreenClockApp:
         self.root.bind('s', lambda _: self.toggle_pause())
         self.root.bind('S', lambda _: self.toggle_pause())
 
+        self.root.bind('p', lambda _: self.select_slideshow())
+        self.root.bind('P', lambda _: self.select_slideshow())
+
+        self.root.bind('n', lambda _: self.next_slide())
+        self.root.bind('N', lambda _: self.next_slide())
+
+        self.root.bind('i', lambda _: self.toggle_metrics_overlay())
+        self.root.bind('I', lambda _: self.toggle_metrics_overlay())
+
+        self.root.bind('d', lambda _: self.dump_metrics())
+        self.root.bind('D', lambda _: self.dump_metrics())
+
         self.root.bind('q', lambda _: self.quit_app())
         self.root.bind('Q', lambda _: self.quit_app())
 
+    def metrics_counters(self) -> dict:
+        counters = {'bg_cache_hits': 0, 'bg_cache_misses': 0, 'bg_cache_hit_rate': None,
+                    'bg_fade_dropped_frames': self._bg_fade.dropped if self._bg_fade else 0,
+                    'bg_animation_stalls': self._bg_player.stalls if self._bg_player else 0,
+                    'text_measure_hits': self.text_metrics.hits,
+                    'text_measure_misses': self.text_metrics.misses,
+                    'http_viewers': self.frame_server.viewers if self.frame_server else 0,
+                    'http_encodes': self.frame_server.encodes if self.frame_server else 0,
+                    'control_commands': self.control_server.handled if self.control_server else 0,
+                    'sync_sent': self.sync.sent if self.sync else 0,
+                    'sync_received': self.sync.received if self.sync else 0}
+        if self._bg_renderer is not None:
+            cache = self._bg_renderer.cache
+            lookups = cache.hits + cache.misses
+            counters.update(bg_cache_hits=cache.hits, bg_cache_misses=cache.misses,
+                            bg_cache_hit_rate=round(cache.hits / lookups, 3) if lookups else None)
+        return counters
+
+    def toggle_metrics_overlay(self) -> None:
+        if self._metrics_after_id is not None:
+            self.root.after_cancel(self._metrics_after_id)
+            self._metrics_after_id = None
+            self.canvas.itemconfigure(self.metrics_item, state='hidden')
+            self.metrics.enabled = self._metrics_were_enabled
+            return
+        self._metrics_were_enabled = self.metrics.enabled
+        self.metrics.enabled = True
+        self.canvas.itemconfigure(self.metrics_item, state='normal')
+        self._refresh_metrics_overlay()
+
+    def _refresh_metrics_overlay(self) -> None:
+        snap = self.metrics.snapshot(self.metrics_counters())
+        lines = []
+        for name, stats in snap['callbacks'].items():
+            lines.append(f"{name:<18} n={stats['count']:<6} avg {stats['avg_ms']:6.2f}  "
+                         f"p95 {stats['p95_ms']:6.2f}  max {stats['max_ms']:7.2f} ms")
+        late = snap['tick_lateness']
+        lines.append(f"{'tick lateness':<18} n={late['count']:<6} p50 {late['p50_ms']:6.2f}  "
+                     f"p95 {late['p95_ms']:6.2f}  max {late['max_ms']:7.2f} ms")
+        lines.append('  ' + '  '.join(f'{k} {v}' for k, v in snap['tick_lateness_histogram'].items()))
+        counters = snap['counters']
+        rate = counters['bg_cache_hit_rate']
+        lines.append(f"{'bg cache':<18} hits {counters['bg_cache_hits']}  misses {counters['bg_cache_misses']}"
+                     f"  rate {'-' if rate is None else f'{rate:.0%}'}")
+        self.canvas.itemconfigure(self.metrics_item, text='\n'.join(lines))
+        self._metrics_after_id = self.root.after(METRICS_OVERLAY_MS, self._refresh_metrics_overlay)
+
+    def dump_metrics(self, path: str | None = None) -> str | None:
+        """Write the current metrics to ``path`` (.json or .csv)."""
+        if path is None:
+            path = self.metrics_dump_path
+        if path is None:
+            stamp = time.strftime('%Y%m%d-%H%M%S')
+            path = os.path.join(self.runtime_dir(), f'metrics-{stamp}.json')
+        snap = self.metrics.snapshot(self.metrics_counters())
+        try:
+            if path.lower().endswith('.csv'):
+                with open(path, 'w', encoding='utf-8', newline='') as f:
+                    writer = csv.writer(f)
+                    writer.writerow(['name', 'count', 'avg_ms', 'p50_ms', 'p95_ms', 'max_ms'])
+                    rows = list(snap['callbacks'].items()) + [('tick_lateness', snap['tick_lateness'])]
+                    for name, stats in rows:
+                        writer.writerow([name, stats['count'], stats['avg_ms'], stats['p50_ms'],
+                                         stats['p95_ms'], stats['max_ms']])
+                    for bucket, count in snap['tick_lateness_histogram'].items():
+                        writer.writerow([f'tick_lateness {bucket}', count, '', '', '', ''])
+                    for name, value in snap['counters'].items():
+                        writer.writerow([name, value, '', '', '', ''])
+            else:
+                with open(path, 'w', encoding='utf-8') as f:
+                    json.dump(snap, f, ensure_ascii=False, indent=2)
+        except OSError as e:
+            print(f"[Full-Screen-Clock] WARNING: Failed to write metrics: {e}",
+                  file=sys.__stdout__ if sys.__stdout__ else sys.stderr)
+            return None
+        print(f"[Full-Screen-Clock] metrics written to {path}",
+              file=sys.__stdout__ if sys.__stdout__ else sys.stderr)
+        return path
+
     def show_help(self) -> None:
         dark_messagebox(self.root, self.t('help_title'), self.t('help_text'),
                         ok_text=self.t('dialog_ok'))
@@ -726,6 +3342,7 @@ class FullscreenClockApp:
         self.is_fullscreen = not self.is_fullscreen
         self.root.attributes('-fullscreen', self.is_fullscreen)
         self._update_fullscreen_btn()
+        self.save_user_state()
 
     def _update_fullscreen_btn(self) -> None:
         if self._toolbar_buttons and len(self._toolbar_buttons) > 10:
@@ -737,76 +3354,79 @@ class FullscreenClockApp:
 
     def quit_app(self) -> None:
         self.running = False
-        self.save_user_state()
+        if self._slideshow_after_id is not None:
+            self.root.after_cancel(self._slideshow_after_id)
+            self._slideshow_after_id = None
+        if self._bg_renderer is not None:
+            self._bg_renderer.shutdown()
+        if self.frame_server is not None:
+            self.frame_server.close()
+        if self.control_server is not None:
+            self.control_server.close()
+        if self.sync is not None:
+            self.sync.close()
+        if self._glyphs is not None:
+            self._glyphs.close()
+        if self._save_after_id is not None:
+            self.root.after_cancel(self._save_after_id)
+            self._save_after_id = None
+        self._state_dirty = False
+        self._state_writer.submit(self.user_state_snapshot())
+        self._state_writer.close()
         self.root.destroy()
 
     def runtime_dir(self) -> str:
-        if getattr(sys, 'frozen', False):
-            return os.path.dirname(sys.executable)
-        return os.path.dirname(os.path.abspath(__file__))
+        return app_runtime_dir()
 
     def state_path(self) -> str:
         return os.path.join(self.runtime_dir(), CONFIG_FILENAME)
 
     def load_user_state(self) -> None:
-        path = self.state_path()
-        if not os.path.exists(path):
-            return
-        try:
-            with open(path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            text = data.get('custom_text')
-            image_path = data.get('bg_path')
-            if isinstance(text, str):
-                self.custom_text = text
-            if isinstance(image_path, str) and os.path.exists(image_path):
-                self.bg_path = image_path
-            if isinstance(data.get('time_font_family'), str):
-                self.time_font_family = data['time_font_family']
-            if isinstance(data.get('time_bold'), bool):
-                self.time_bold = data['time_bold']
-            if isinstance(data.get('time_shadow'), bool):
-                self.time_shadow = data['time_shadow']
-            if isinstance(data.get('text_font_family'), str):
-                self.text_font_family = data['text_font_family']
-            if isinstance(data.get('text_bold'), bool):
-                self.text_bold = data['text_bold']
-            if isinstance(data.get('desc_color'), str) and data['desc_color'].startswith('#'):
-                self.desc_color = data['desc_color']
-        except Exception as e:
-            print(f"[Full-Screen-Clock] WARNING: Failed to load user_state.json: {e}",
-                  file=sys.__stdout__ if sys.__stdout__ else sys.stderr)
-            return
+        for key, value in read_user_state(self.state_path()).items():
+            setattr(self, key, value)
+
+        # Timer anchors are wall-clock timestamps, so a restarted process
+        # resumes a running count exactly where the old one would be now.
+        if self.mode == 'clock':
+            self.count_start = None
+        if not self.paused:
+            self.pause_started_at = None
+        elif self.pause_started_at is None:
+            self.paused = False
 
     def save_user_state(self) -> None:
-        path = self.state_path()
-        data = {
-            'custom_text': self.custom_text,
-            'bg_path': self.bg_path,
-            'time_font_family': self.time_font_family,
-            'time_bold': self.time_bold,
-            'time_shadow': self.time_shadow,
-            'text_font_family': self.text_font_family,
-            'text_bold': self.text_bold,
-            'desc_color': self.desc_color,
-        }
-        try:
-            with open(path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
-        except Exception:
+        """Mark the state dirty; it is written once edits settle."""
+        self._state_dirty = True
+        if self._save_after_id is not None:
+            self.root.after_cancel(self._save_after_id)
+        self._save_after_id = self.root.after(STATE_SAVE_DEBOUNCE_MS, self._flush_user_state)
+
+    def _flush_user_state(self) -> None:
+        self._save_after_id = None
+        if not self._state_dirty:
             return
+        self._state_dirty = False
+        self._state_writer.submit(self.user_state_snapshot())
+
+    def user_state_snapshot(self) -> dict:
+        data = {'version': STATE_SCHEMA_VERSION}
+        for key in STATE_FIELDS:
+            data[key] = getattr(self, key)
+        return data
 
-    def set_mode(self, mode: str) -> None:
+    def set_mode(self, mode: str, seconds: int | None = None) -> None:
+        """Switch modes; a countdown asks for its length unless ``seconds`` is given."""
         self.mode = mode
         self.paused = False
         self.paused_duration = 0
         self.pause_started_at = None
 
         if mode == 'countdown':
-            seconds = dark_askinteger(self.root, self.t('mode_countdown'),
-                                       self.t('dialog_countdown_prompt'),
-                                       minvalue=1, ok_text=self.t('dialog_ok'),
-                                       cancel_text=self.t('dialog_cancel'))
+            if seconds is None:
+                seconds = dark_askinteger(self.root, self.t('mode_countdown'),
+                                           self.t('dialog_countdown_prompt'),
+                                           minvalue=1, ok_text=self.t('dialog_ok'),
+                                           cancel_text=self.t('dialog_cancel'))
             if seconds is None:
                 self.mode = 'clock'
                 self.count_start = None
@@ -825,6 +3445,8 @@ class FullscreenClockApp:
             self.set_mode('countdown')
         else:
             self.set_mode('clock')
+        self.request_tick()
+        self.save_user_state()
 
     def set_time_value(self) -> None:
         if self.mode == 'clock':
@@ -835,16 +3457,7 @@ class FullscreenClockApp:
             if not value:
                 return
             try:
-                parts = value.split(':')
-                if len(parts) != 3:
-                    raise ValueError
-                hh, mm, ss = [int(x) for x in parts]
-                if not (0 <= hh <= 23 and 0 <= mm <= 59 and 0 <= ss <= 59):
-                    raise ValueError
-                now = time.localtime()
-                now_seconds = now.tm_hour * 3600 + now.tm_min * 60 + now.tm_sec
-                target_seconds = hh * 3600 + mm * 60 + ss
-                self.clock_offset_seconds = target_seconds - now_seconds
+                self.apply_time_value(value)
             except ValueError:
                 dark_messagebox(self.root, self.t('dialog_time_error'),
                                 self.t('dialog_time_error_msg'), error=True,
@@ -856,25 +3469,40 @@ class FullscreenClockApp:
                                        self.t('dialog_countup_prompt'),
                                        minvalue=0, ok_text=self.t('dialog_ok'),
                                        cancel_text=self.t('dialog_cancel'))
-            if seconds is None:
-                return
-            self.count_start = time.time() - seconds
+        else:
+            seconds = dark_askinteger(self.root, self.t('mode_countdown'),
+                                       self.t('dialog_countdown_prompt'),
+                                       minvalue=1, ok_text=self.t('dialog_ok'),
+                                       cancel_text=self.t('dialog_cancel'))
+        if seconds is not None:
+            self.apply_time_value(seconds)
+
+    def apply_time_value(self, value: str | int) -> None:
+        """Set the clock to an 'HH:MM:SS' string, or the running count to ``value`` seconds."""
+        if self.mode == 'clock':
+            parts = str(value).split(':')
+            if len(parts) != 3:
+                raise ValueError('expected HH:MM:SS')
+            hh, mm, ss = [int(x) for x in parts]
+            if not (0 <= hh <= 23 and 0 <= mm <= 59 and 0 <= ss <= 59):
+                raise ValueError('expected HH:MM:SS')
+            now = time.localtime()
+            now_seconds = now.tm_hour * 3600 + now.tm_min * 60 + now.tm_sec
+            target_seconds = hh * 3600 + mm * 60 + ss
+            self.clock_offset_seconds = target_seconds - now_seconds
+        else:
+            if isinstance(value, str):
+                raise ValueError('expected a number of seconds')
+            if self.mode == 'countup':
+                self.count_start = time.time() - value
+            else:
+                self.countdown_total = value
+                self.count_start = time.time()
             self.paused = False
             self.paused_duration = 0
             self.pause_started_at = None
-            return
-
-        seconds = dark_askinteger(self.root, self.t('mode_countdown'),
-                                   self.t('dialog_countdown_prompt'),
-                                   minvalue=1, ok_text=self.t('dialog_ok'),
-                                   cancel_text=self.t('dialog_cancel'))
-        if seconds is None:
-            return
-        self.countdown_total = seconds
-        self.count_start = time.time()
-        self.paused = False
-        self.paused_duration = 0
-        self.pause_started_at = None
+        self.request_tick()
+        self.save_user_state()
 
     def open_style_panel(self) -> None:
         if self.style_panel and self.style_panel.winfo_exists():
@@ -943,6 +3571,15 @@ class FullscreenClockApp:
             font=('Segoe UI', 10), fg='#c8c8e0', bg='#0d0d18',
             selectcolor='#1a1a28', activebackground='#0d0d18',
             activeforeground='#ffffff',
+        ).pack(side='left', padx=(0, 20))
+
+        self._auto_fit_var = tk.BooleanVar(value=self.auto_fit)
+        tk.Checkbutton(
+            toggles_row, text=self.t('auto_fit_label'), variable=self._auto_fit_var,
+            command=self._apply_style,
+            font=('Segoe UI', 10), fg='#c8c8e0', bg='#0d0d18',
+            selectcolor='#1a1a28', activebackground='#0d0d18',
+            activeforeground='#ffffff',
         ).pack(side='left')
 
         # ── Text font & weight ──
@@ -996,6 +3633,28 @@ class FullscreenClockApp:
         self._style_swatch = swatch
         self._apply_style()
 
+        def _forget_style_panel(event) -> None:
+            # However the panel goes away (Close, the window X, a language
+            # switch), drop the references to its widgets.
+            if event.widget is not panel:
+                return
+            self._style_swatch = None
+            self._font_var = None
+            self._bold_var = None
+            self._shadow_var = None
+            self._auto_fit_var = None
+            self._text_font_var = None
+            self._text_bold_var = None
+            if self.style_panel is panel:
+                self.style_panel = None
+
+        def _on_style_panel_close() -> None:
+            if panel.winfo_exists():
+                panel.destroy()
+
+        panel.bind('<Destroy>', _forget_style_panel)
+        panel.protocol('WM_DELETE_WINDOW', _on_style_panel_close)
+
         btn_row = tk.Frame(panel, bg='#0d0d18')
         btn_row.pack(fill='x', padx=12, pady=(4, 12))
 
@@ -1013,19 +3672,6 @@ class FullscreenClockApp:
             pady=5,
         ).pack(side='right', padx=4)
 
-        def _on_style_panel_close() -> None:
-            self._style_swatch = None
-            self._font_var = None
-            self._bold_var = None
-            self._shadow_var = None
-            self._text_font_var = None
-            self._text_bold_var = None
-            self.style_panel = None
-            if panel.winfo_exists():
-                panel.destroy()
-
-        panel.protocol('WM_DELETE_WINDOW', _on_style_panel_close)
-
     def _create_scale(
         self,
         parent: tk.Toplevel,
@@ -1090,46 +3736,140 @@ class FullscreenClockApp:
         return scale
 
     def _apply_style(self, _event=None) -> None:
+        # Slider drags fire many callbacks per frame; fold them into one commit.
+        if self._style_after_id is None:
+            self._style_after_id = self.root.after(STYLE_FRAME_MS, self._commit_style)
+
+    def _read_style_controls(self) -> dict | None:
         if not all([self.time_size_scale, self.text_size_scale, self.bg_size_scale,
                      self.r_scale, self.g_scale, self.b_scale]):
+            return None
+        try:
+            wanted = {
+                'time_font_size': int(self.time_size_scale.get()),
+                'text_font_size': int(self.text_size_scale.get()),
+                'bg_scale_percent': int(self.bg_size_scale.get()),
+                'text_color': self.rgb_to_hex(int(self.r_scale.get()), int(self.g_scale.get()),
+                                              int(self.b_scale.get())),
+            }
+            if getattr(self, '_font_var', None) is not None:
+                wanted['time_font_family'] = self._font_var.get()
+            if getattr(self, '_bold_var', None) is not None:
+                wanted['time_bold'] = self._bold_var.get()
+            if getattr(self, '_shadow_var', None) is not None:
+                wanted['time_shadow'] = self._shadow_var.get()
+            if getattr(self, '_auto_fit_var', None) is not None:
+                wanted['auto_fit'] = self._auto_fit_var.get()
+            if getattr(self, '_text_font_var', None) is not None:
+                wanted['text_font_family'] = self._text_font_var.get()
+            if getattr(self, '_text_bold_var', None) is not None:
+                wanted['text_bold'] = self._text_bold_var.get()
+        except tk.TclError:
+            return None  # panel was closed while a commit was pending
+        return wanted
+
+    @instrumented('commit_style')
+    def _commit_style(self) -> None:
+        self._style_after_id = None
+        wanted = self._read_style_controls()
+        if wanted is not None:
+            self.apply_style(wanted)
+
+    def apply_style(self, wanted: dict) -> None:
+        """Set style properties, redoing only the work the changed ones affect."""
+        changed = {key for key, value in wanted.items() if getattr(self, key) != value}
+        if not changed:
             return
-        self.time_font_size = int(self.time_size_scale.get())
-        self.text_font_size = int(self.text_size_scale.get())
-        self.bg_scale_percent = int(self.bg_size_scale.get())
-        self.text_color = self.rgb_to_hex(int(self.r_scale.get()), int(self.g_scale.get()), int(self.b_scale.get()))
-
-        if hasattr(self, '_font_var') and self._font_var is not None:
-            self.time_font_family = self._font_var.get()
-        if hasattr(self, '_bold_var') and self._bold_var is not None:
-            self.time_bold = self._bold_var.get()
-        if hasattr(self, '_shadow_var') and self._shadow_var is not None:
-            self.time_shadow = self._shadow_var.get()
-
-        if hasattr(self, '_text_font_var') and self._text_font_var is not None:
-            self.text_font_family = self._text_font_var.get()
-        if hasattr(self, '_text_bold_var') and self._text_bold_var is not None:
-            self.text_bold = self._text_bold_var.get()
-
-        if hasattr(self, '_style_swatch') and self._style_swatch is not None:
-            self._style_swatch.configure(bg=self.text_color)
-        self.apply_time_font()
-        self.redraw_background()
+        for key in changed:
+            setattr(self, key, wanted[key])
+        self._sync_style_controls(changed)
+
+        refit = False
+        if changed & (FONT_STYLE_KEYS | {'custom_text'}):
+            refit = self.refit_fonts()
+            self.apply_time_font()
+        if changed & {'custom_text', 'desc_color'}:
+            self._last_desc_key = None
+            self.request_tick()
+        if refit or 'time_font_size' in changed:
+            self.position_elements()  # shadow offset follows the font size
+        if 'text_color' in changed:
+            swatch = getattr(self, '_style_swatch', None)
+            if swatch is not None and swatch.winfo_exists():
+                swatch.configure(bg=self.text_color)
+            self.request_tick()
+        if 'bg_scale_percent' in changed:
+            self.preview_background()
+            if self._bg_refine_id is not None:
+                self.root.after_cancel(self._bg_refine_id)
+            self._bg_refine_id = self.root.after(BG_REFINE_DELAY_MS, self._refine_background)
         self.save_user_state()
 
+    def _sync_style_controls(self, changed: set) -> None:
+        # Changes from elsewhere (the control API) must show in an open style
+        # panel, or its next commit would put the panel's stale values back.
+        if self.style_panel is None:
+            return
+        controls = {
+            'time_font_size': self.time_size_scale,
+            'text_font_size': self.text_size_scale,
+            'bg_scale_percent': self.bg_size_scale,
+            'time_font_family': self._font_var,
+            'time_bold': self._bold_var,
+            'time_shadow': self._shadow_var,
+            'auto_fit': self._auto_fit_var,
+            'text_font_family': self._text_font_var,
+            'text_bold': self._text_bold_var,
+        }
+        try:
+            for key in changed:
+                if controls.get(key) is not None:
+                    controls[key].set(getattr(self, key))
+            if 'text_color' in changed:
+                for scale, value in zip((self.r_scale, self.g_scale, self.b_scale),
+                                        self.hex_to_rgb(self.text_color)):
+                    scale.set(value)
+        except tk.TclError:
+            pass  # the panel is being destroyed
+
     def _time_font(self) -> tuple:
         weight = 'bold' if self.time_bold else 'normal'
-        return (self.time_font_family, self.time_font_size, weight)
+        return (self.time_font_family, self.effective_font_sizes()[0], weight)
 
     def _desc_font(self) -> tuple:
         weight = 'bold' if self.text_bold else 'normal'
-        return (self.text_font_family, self.text_font_size, weight)
+        return (self.text_font_family, self.effective_font_sizes()[1], weight)
+
+    def effective_font_sizes(self) -> tuple[int, int]:
+        """Time and description font sizes in use (after auto-fit)."""
+        return self._fitted_sizes or (self.time_font_size, self.text_font_size)
+
+    def refit_fonts(self) -> bool:
+        """Recompute auto-fit sizes for the window; True if they changed."""
+        fitted = None
+        width, height = self.root.winfo_width(), self.root.winfo_height()
+        if self.auto_fit and min(width, height) > 1:
+            fitted = self._fit_font_sizes(width, height)
+        if fitted == self._fitted_sizes:
+            return False
+        self._fitted_sizes = fitted
+        return True
+
+    def _fit_font_sizes(self, width: int, height: int) -> tuple[int, int]:
+        return fit_scene_fonts(self.text_metrics, self, width, height)
 
     def apply_time_font(self) -> None:
         time_font = self._time_font()
         state = 'normal' if self.time_shadow else 'hidden'
-        self.canvas.itemconfigure(self.time_shadow_item, font=time_font, state=state)
+        if self._glyphs is not None:
+            self._last_time_key = None  # the atlas follows font and shadow
+            self.request_tick()
+        self.canvas.itemconfigure(self.time_shadow_item, font=time_font,
+                                  state='hidden' if self._glyphs_active else state)
         self.canvas.itemconfigure(self.time_item, font=time_font)
         self.canvas.itemconfigure(self.desc_item, font=self._desc_font())
+        for display in self.displays:
+            display.apply_fonts(time_font, self._desc_font(), state)
 
     def reset_mode_timer(self) -> None:
         if self.mode in ('countup', 'countdown'):
@@ -1137,6 +3877,8 @@ class FullscreenClockApp:
             self.paused = False
             self.paused_duration = 0
             self.pause_started_at = None
+            self.request_tick()
+            self.save_user_state()
 
     def toggle_pause(self) -> None:
         if self.mode not in ('countup', 'countdown'):
@@ -1150,22 +3892,78 @@ class FullscreenClockApp:
             if self.pause_started_at is not None:
                 self.paused_duration += time.time() - self.pause_started_at
             self.pause_started_at = None
+        self.request_tick()
+        self.save_user_state()
 
     def on_resize(self, _event=None) -> None:
         new_size = (self.root.winfo_width(), self.root.winfo_height())
-        if new_size == self._last_size:
+        if new_size == self._last_size or min(new_size) <= 1:
             return
+        first_layout = self._last_size == (0, 0)
         self._last_size = new_size
         if hasattr(self, '_resize_after_id') and self._resize_after_id:
             self.root.after_cancel(self._resize_after_id)
-        self._resize_after_id = self.root.after(300, self._flush_resize)
+        if first_layout:
+            self._flush_resize()
+            return
+        # While the drag goes on, text and a preview follow at frame rate;
+        # the full render waits until the size stops changing.
+        if self._bg_preview_id is None:
+            self._bg_preview_id = self.root.after(STYLE_FRAME_MS, self._live_resize_frame)
+        self._resize_after_id = self.root.after(BG_REFINE_DELAY_MS, self._flush_resize)
+
+    def _live_resize_frame(self) -> None:
+        self._bg_preview_id = None
+        if self.refit_fonts():
+            self.apply_time_font()
+        self.position_elements()
+        self.preview_background()
 
+    @instrumented('flush_resize')
     def _flush_resize(self) -> None:
         self._resize_after_id = None
+        if self._bg_preview_id is not None:
+            self.root.after_cancel(self._bg_preview_id)
+            self._bg_preview_id = None
+        if self.refit_fonts():
+            self.apply_time_font()
+        if not self._first_paint_done:
+            # Paint the clock on the solid colour first; Pillow and the
+            # background decode follow once the frame is on screen.
+            self.position_elements()
+            self.root.update_idletasks()
+            self._first_paint_done = True
+            self.profiler.mark('first_paint')
+            self.root.after(0, self._after_first_paint)
+            return
         self.redraw_background()
         self.position_elements()
 
+    def _after_first_paint(self) -> None:
+        if self.glyph_time and load_pillow():
+            self._glyphs = TimeGlyphs(self.canvas)
+            self.position_elements()
+            self._last_time_key = None
+            self.request_tick()
+        if self.slideshow_source:
+            self.start_slideshow(self.slideshow_source, quiet=True)
+        else:
+            self.redraw_background()
+        if not self._bg_jobs:
+            self.profiler.report()  # nothing left to wait for
+        if self.show_help_on_start:
+            self.show_help()
+
+    def _background_renderer(self) -> BackgroundRenderer | None:
+        if self._bg_renderer is None and load_pillow():
+            self.profiler.mark('pillow_imported')
+            self._bg_renderer = BackgroundRenderer(RenditionCache(
+                os.path.join(self.runtime_dir(), RENDITION_DIRNAME), raw=self.mmap_renditions))
+        return self._bg_renderer
+
     def select_background_image(self) -> None:
+        from tkinter import filedialog
+
         path = filedialog.askopenfilename(
             title=self.t('dialog_bg_file_title'),
             filetypes=[('Image Files', '*.png;*.jpg;*.jpeg;*.bmp;*.gif;*.ppm;*.pgm'), ('All Files', '*.*')],
@@ -1173,7 +3971,7 @@ class FullscreenClockApp:
         if not path:
             return
 
-        if Image is None:
+        if not load_pillow():
             ext = os.path.splitext(path)[1].lower()
             tk_supported = {'.png', '.gif', '.ppm', '.pgm'}
             if ext not in tk_supported:
@@ -1182,23 +3980,176 @@ class FullscreenClockApp:
                                 ok_text=self.t('dialog_ok'))
                 return
 
-        self.bg_path = path
-        self._bg_pil_image = None
-        self._bg_pil_path = None
-        self.save_user_state()
-        self.redraw_background()
+        self.set_background(path)
 
     def select_background_color(self) -> None:
+        from tkinter import colorchooser
+
         chosen = colorchooser.askcolor(title=self.t('dialog_bg_color_title'))[1]
         if not chosen:
             return
-        self.bg_color = chosen
-        self.bg_path = None
-        self._bg_pil_image = None
-        self._bg_pil_path = None
+        self.set_background(None, chosen)
+
+    def set_background(self, path: str | None, color: str | None = None) -> None:
+        """Show the image at ``path`` (None for none) and stop any slideshow."""
+        if color is not None:
+            self.bg_color = color
+        self.stop_slideshow()
+        self.bg_path = path
+        if self._bg_renderer is not None:
+            self._bg_renderer.invalidate()
         self.save_user_state()
         self.redraw_background()
 
+    def select_slideshow(self) -> None:
+        from tkinter import filedialog
+
+        folder = filedialog.askdirectory(title=self.t('dialog_slideshow_title'))
+        if not folder:
+            return
+        seconds = dark_askinteger(self.root, self.t('dialog_slideshow_title'),
+                                  self.t('dialog_slideshow_interval_prompt'),
+                                  initialvalue=str(self.slideshow_interval_s),
+                                  minvalue=SLIDESHOW_MIN_INTERVAL_S, ok_text=self.t('dialog_ok'),
+                                  cancel_text=self.t('dialog_cancel'))
+        if seconds is None:
+            return
+        self.slideshow_interval_s = seconds
+        self.start_slideshow(folder)
+
+    def start_slideshow(self, source: str, *, quiet: bool = False) -> None:
+        try:
+            paths = load_slideshow(source)
+        except OSError as exc:
+            paths, error = [], exc
+        else:
+            error = None
+        if not paths:
+            self.slideshow_source = None
+            self.redraw_background()
+            if not quiet:
+                detail = f'{self.t("dialog_slideshow_empty")}: {error or source}'
+                dark_messagebox(self.root, self.t('dialog_bg_error'), detail, error=True,
+                                ok_text=self.t('dialog_ok'))
+            return
+        self.stop_slideshow()
+        self.slideshow_source = source
+        self.slideshow_paths = paths
+        # Resume at the image that was showing before a restart.
+        index = paths.index(self.bg_path) if self.bg_path in paths else 0
+        if self._bg_renderer is not None:
+            self._bg_renderer.invalidate()
+        self._show_slide(index)
+        self.save_user_state()
+
+    def stop_slideshow(self) -> None:
+        if self._slideshow_after_id is not None:
+            self.root.after_cancel(self._slideshow_after_id)
+            self._slideshow_after_id = None
+        self._cancel_slide_prefetch()
+        self.slideshow_source = None
+        self.slideshow_paths = []
+        self._slide_failed.clear()
+
+    def next_slide(self) -> None:
+        if not self.slideshow_paths:
+            return
+        upcoming = self._upcoming_slides(1)
+        if not upcoming:
+            # Every image failed to load; fall back to the solid colour.
+            self.stop_slideshow()
+            self.bg_path = None
+            self.redraw_background()
+            self.save_user_state()
+            return
+        self._show_slide(self.slideshow_paths.index(upcoming[0]))
+
+    def _upcoming_slides(self, count: int) -> list[str]:
+        paths = self.slideshow_paths
+        upcoming = []
+        for step in range(1, len(paths) + 1):
+            path = paths[(self.slideshow_index + step) % len(paths)]
+            if path in self._slide_failed or path in upcoming:
+                continue
+            upcoming.append(path)
+            if len(upcoming) == count:
+                break
+        return upcoming
+
+    def _background_targets(self) -> list[tuple[str, int, int]]:
+        targets = [('main', max(self.root.winfo_width(), 1), max(self.root.winfo_height(), 1))]
+        targets.extend((display.target, *display.size()) for display in self.displays)
+        return targets
+
+    @instrumented('show_slide')
+    def _show_slide(self, index: int) -> None:
+        if self._slideshow_after_id is not None:
+            self.root.after_cancel(self._slideshow_after_id)
+        self._slideshow_after_id = self.root.after(self.slideshow_interval_s * 1000, self.next_slide)
+        self.slideshow_index = index
+        self.bg_path = self.slideshow_paths[index]
+        self.save_user_state()
+        self._stop_animation()
+        if self._bg_renderer is None:
+            self.redraw_background()
+            return
+        # Prefetched slides already have a PhotoImage per target, so the swap
+        # (or the last frame of the cross-fade) is one itemconfigure.
+        for target, width, height in self._background_targets():
+            ready = self._slide_ready.pop(target, None)
+            if ready is not None and ready[0] == (self.bg_path, width, height, self.bg_scale_percent):
+                self._deliver_background(target, ready[1], ready[2])
+            else:
+                self._request_background(target, width, height)
+        self._prefetch_slides()
+
+    def _cancel_slide_prefetch(self) -> None:
+        for job in self._slide_prefetch:
+            self._bg_jobs.pop(job, None)
+            if self._bg_renderer is not None:
+                self._bg_renderer.cancel(job)
+        self._slide_prefetch.clear()
+        self._slide_ready.clear()
+        self._slide_prefetch_key = None
+
+    def _prefetch_slides(self) -> None:
+        renderer = self._bg_renderer
+        if renderer is None or not self.slideshow_paths:
+            self._cancel_slide_prefetch()
+            return
+        upcoming = self._upcoming_slides(SLIDESHOW_PREFETCH)
+        targets = self._background_targets()
+        # Resizes and scale commits redraw often; the same slides at the same
+        # sizes are already rendered or on their way.
+        key = (tuple(upcoming), tuple(targets), self.bg_scale_percent)
+        if key == self._slide_prefetch_key:
+            return
+        self._cancel_slide_prefetch()
+        self._slide_prefetch_key = key
+        for target, width, height in targets:
+            for i, path in enumerate(upcoming):
+                key = (path, width, height, self.bg_scale_percent)
+                if key in renderer.cache:
+                    if i == 0:
+                        img = renderer.cache.get(key)
+                        self._slide_ready[target] = (key, img, ImageTk.PhotoImage(img))
+                    continue
+                job = f'prefetch:{target}:{path}'
+                self._slide_prefetch[job] = (target, path)
+                self._bg_jobs[job] = renderer.submit(path, width, height, self.bg_scale_percent, target=job)
+        if self._bg_jobs:
+            self._poll_background_results()
+
+    def _slide_prefetched(self, job: str, img, exc: Exception | None) -> None:
+        target, path = self._slide_prefetch.pop(job)
+        if exc is not None:
+            self._slide_failed.add(path)
+            return
+        upcoming = self._upcoming_slides(1)
+        if upcoming and upcoming[0] == path:
+            size = next((w, h) for t, w, h in self._background_targets() if t == target)
+            self._slide_ready[target] = ((path, *size, self.bg_scale_percent), img, ImageTk.PhotoImage(img))
+
     def edit_custom_text(self) -> None:
         text = dark_asktext(self.root, self.t('text'),
                             self.t('dialog_custom_text_prompt'),
@@ -1209,74 +4160,315 @@ class FullscreenClockApp:
             return
         self.custom_text = text
         self._last_desc_key = None
+        if self.refit_fonts():
+            self.apply_time_font()
+            self.position_elements()
+        self.request_tick()
         self.save_user_state()
 
     def edit_desc_color(self) -> None:
+        from tkinter import colorchooser
+
         chosen = colorchooser.askcolor(title=self.t('desc_color'),
                                        initialcolor=self.desc_color)[1]
         if not chosen:
             return
         self.desc_color = chosen
         self._last_desc_key = None
+        self.request_tick()
         self.save_user_state()
 
+    @instrumented('redraw_background')
     def redraw_background(self) -> None:
         width = max(self.root.winfo_width(), 1)
         height = max(self.root.winfo_height(), 1)
 
         self.canvas.configure(bg=self.bg_color)
-        self.canvas.delete('bg')
+        self._stop_animation()
+
+        if not self.bg_path:
+            self._bg_jobs.clear()
+            if self._bg_renderer is not None:
+                self._bg_renderer.cancel()
+                self._bg_renderer.release_animation()
+            previous, self._bg_image, self._bg_image_path = self._bg_image, None, None
+            if previous is not None:
+                self._start_background_fade(previous, None, self._clear_main_background)
+            else:
+                self._cancel_background_fade()
+                self._clear_main_background()
+            for display in self.displays:
+                display.clear_background()
+            return
 
-        if self.bg_path:
+        if self._background_renderer() is None:
+            self.canvas.delete('bg')
             try:
-                if Image is not None:
-                    # ── Cache PIL image to avoid disk I/O on every resize ──
-                    if self._bg_pil_image is None or self._bg_pil_path != self.bg_path:
-                        self._bg_pil_image = Image.open(self.bg_path)
-                        self._bg_pil_path = self.bg_path
-                    img = self._bg_pil_image
-                    src_w, src_h = img.size
-                    if src_w <= 0 or src_h <= 0:
-                        raise ValueError(self.t('dialog_bg_invalid_size'))
-
-                    base_scale = max(width / src_w, height / src_h)
-                    final_scale = base_scale * (self.bg_scale_percent / 100.0)
-                    dst_w = max(int(src_w * final_scale), 1)
-                    dst_h = max(int(src_h * final_scale), 1)
-
-                    # ── Release old PhotoImage before creating new one ──
-                    old_photo = self.bg_photo
-                    self.bg_photo = None
-                    if old_photo is not None:
-                        try:
-                            del old_photo
-                        except Exception:
-                            pass
-
-                    resized = img.resize((dst_w, dst_h), Image.Resampling.BILINEAR)
-                    self.bg_photo = ImageTk.PhotoImage(resized)
-                    x = (width - dst_w) // 2
-                    y = (height - dst_h) // 2
-                    self.canvas.create_image(x, y, image=self.bg_photo, anchor='nw', tags='bg')
-                else:
-                    img = tk.PhotoImage(file=self.bg_path)
-                    self.bg_photo = img
-                    self.canvas.create_image(width / 2, height / 2, image=self.bg_photo, anchor='center', tags='bg')
+                img = tk.PhotoImage(file=self.bg_path)
+                self.bg_photo = img
+                self.canvas.create_image(width / 2, height / 2, image=self.bg_photo, anchor='center', tags='bg')
+                for display in self.displays:
+                    display.canvas.configure(bg=self.bg_color)
+                    display.show_photo(img, centered=True)
             except Exception as exc:
-                self.bg_path = None
-                dark_messagebox(self.root, self.t('dialog_bg_error'),
-                                f'{self.t("dialog_bg_load_fail")}: {exc}', error=True,
-                                ok_text=self.t('dialog_ok'))
+                self._background_failed('main', exc)
+            else:
+                if os.path.splitext(self.bg_path)[1].lower() == '.gif':
+                    self._tk_frames_after_id = self.root.after_idle(self._load_tk_frame, self.bg_path, 0)
+            self.canvas.tag_lower('bg')
+            return
+
+        self._request_background('main', width, height)
+        for display in self.displays:
+            self.request_display_background(display)
+        self._prefetch_slides()
+
+    @instrumented('preview_background')
+    def preview_background(self) -> None:
+        """Show a fast low-quality render now; the final one comes later."""
+        renderer = self._bg_renderer
+        if renderer is None or not self.bg_path:
+            return
+        width = max(self.root.winfo_width(), 1)
+        height = max(self.root.winfo_height(), 1)
+        if (self.bg_path, width, height, self.bg_scale_percent) in renderer.cache:
+            self._request_background('main', width, height)
+            return
+        img = renderer.preview(self.bg_path, width, height, self.bg_scale_percent)
+        if img is None:
+            return  # nothing decoded yet; the refinement does the first load
+        # A refinement for an older size would only be replaced again.
+        if self._bg_jobs.pop('main', None) is not None:
+            renderer.cancel('main')
+        self._stop_animation()
+        self._place_background_photo('main', ImageTk.PhotoImage(img))
+
+    def _refine_background(self) -> None:
+        self._bg_refine_id = None
+        self.redraw_background()
+
+    def request_display_background(self, display: ClockDisplay) -> None:
+        display.canvas.configure(bg=self.bg_color)
+        if not self.bg_path:
+            display.clear_background()
+        elif self._background_renderer() is not None:
+            self._request_background(display.target, *display.size())
+
+    def _request_background(self, target: str, width: int, height: int) -> None:
+        # ── Cached renders paint immediately; everything else goes to the worker ──
+        cached = self._bg_renderer.cache.get((self.bg_path, width, height, self.bg_scale_percent))
+        if cached is not None:
+            self._bg_jobs.pop(target, None)
+            self._bg_renderer.cancel(target)
+            self._deliver_background(target, cached)
+            return
+        self._bg_jobs[target] = self._bg_renderer.submit(
+            self.bg_path, width, height, self.bg_scale_percent, target=target)
+        self._poll_background_results()
+
+    def _poll_background_results(self) -> None:
+        if self._bg_poll_id is None:
+            self._bg_poll_id = self.root.after(BG_POLL_MS, self._drain_background_results)
+
+    @instrumented('drain_background')
+    def _drain_background_results(self) -> None:
+        self._bg_poll_id = None
+        if not self.running:
+            return
+        while True:
+            try:
+                target, generation, img, exc = self._bg_renderer.results.get_nowait()
+            except queue.Empty:
+                break
+            if self._bg_jobs.get(target) != generation:
+                continue  # superseded by a newer size/scale request
+            del self._bg_jobs[target]
+            if target in self._slide_prefetch:
+                self._slide_prefetched(target, img, exc)
+            elif target == 'animation':
+                self._animation_ready(img, exc)
+            elif exc is not None:
+                self._background_failed(target, exc)
+            else:
+                self._deliver_background(target, img)
+        if self._bg_jobs:
+            self._bg_poll_id = self.root.after(BG_POLL_MS, self._drain_background_results)
+
+    def _deliver_background(self, target: str, img, photo=None) -> None:
+        if target == 'main':
+            self._show_background(img, photo)
+        else:
+            self._place_background_photo(target, photo or ImageTk.PhotoImage(img))
+
+    def _place_background_photo(self, target: str, photo) -> None:
+        if target == 'main':
+            self._cancel_background_fade()
+            place_background_item(self.canvas, photo, max(self.root.winfo_width(), 1),
+                                  max(self.root.winfo_height(), 1))
+            self.bg_photo = photo
+            return
+        for display in self.displays:
+            if display.target == target:
+                display.show_photo(photo)
+                return
+
+    def _background_failed(self, target: str, exc: Exception) -> None:
+        if self.slideshow_paths and self.bg_path:
+            # A broken slide is skipped rather than ending the show.
+            print(f'[Full-Screen-Clock] WARNING: Skipping slide {self.bg_path}: {exc}',
+                  file=sys.__stdout__ if sys.__stdout__ else sys.stderr)
+            self._slide_failed.add(self.bg_path)
+            self.next_slide()
+            return
+        self._bg_jobs.clear()
+        self._show_background_error(exc)
+
+    def _show_background(self, img, photo=None) -> None:
+        if self._awaiting_first_background:
+            self._awaiting_first_background = False
+            self.profiler.mark('background_ready')
+            self.profiler.report()
+        photo = photo or ImageTk.PhotoImage(img)
+        previous, self._bg_image = self._bg_image, img
+        self._stop_animation()
+        # Each file is probed for frames once; a known still is never resubmitted.
+        animated = (os.path.splitext(self.bg_path)[1].lower() in BG_ANIMATED_EXTENSIONS
+                    and self._bg_renderer.animated.get(self.bg_path, True))
+        if animated:
+            width, height = max(self.root.winfo_width(), 1), max(self.root.winfo_height(), 1)
+            self._bg_jobs['animation'] = self._bg_renderer.submit_animation(
+                self.bg_path, width, height, self.bg_scale_percent)
+            self._poll_background_results()
+        if self._bg_image_path == self.bg_path:
+            # Same picture at a new size or zoom: no transition.
+            self._place_background_photo('main', photo)
+            return
+        self._bg_image_path = self.bg_path
+        if not animated:
+            self._bg_renderer.release_animation()
+
+        def _faded() -> None:
+            self._place_background_photo('main', photo)
+            self._start_animation()
+
+        self._start_background_fade(previous, img, _faded)
+
+    def _start_background_fade(self, old, new, on_done) -> None:
+        if self._bg_fade is None:
+            self._bg_fade = CrossFade(self.root, self.metrics)
+        size = (max(self.root.winfo_width(), 1), max(self.root.winfo_height(), 1))
+        self._bg_fade.start(self.canvas, old, new, self.bg_color, size, on_done)
+
+    def _cancel_background_fade(self) -> None:
+        if self._bg_fade is not None:
+            self._bg_fade.cancel()
+
+    def _clear_main_background(self) -> None:
+        self.canvas.delete('bg')
+        self.bg_photo = None
+
+    # ── Animated backgrounds ──
+
+    def _animation_ready(self, info, exc: Exception | None) -> None:
+        if exc is not None:
+            print(f'[Full-Screen-Clock] WARNING: Animation disabled for {self.bg_path}: {exc}',
+                  file=sys.__stdout__ if sys.__stdout__ else sys.stderr)
+            self._stop_animation()
+            return
+        if self._bg_player is not None:
+            self._bg_stream_pending = False  # a streamed chunk has landed
+            return
+        self._bg_animation = info
+        self._start_animation()
+
+    def _start_animation(self) -> None:
+        # Playback waits for a running cross-fade; its end starts it again.
+        if self._bg_animation is None or self._bg_player is not None:
+            return
+        if self._bg_fade is not None and self._bg_fade.active:
+            return
+        key, count, streamed = self._bg_animation
+        frames = self._bg_renderer.frames
+        first = frames.get(key + (0,))
+        if first is None:
+            return
+        photo = ImageTk.PhotoImage(first[0])
+        self._place_background_photo('main', photo)
+
+        def _advance(index: int) -> None:
+            ahead = (index + BG_FRAME_STREAM_AHEAD // 2) % count
+            if self._bg_stream_pending or key + (ahead,) in frames:
+                return
+            self._bg_stream_pending = True
+            self._bg_jobs['animation'] = self._bg_renderer.submit_animation(*key, start=(index + 1) % count)
+            self._poll_background_results()
+
+        self._bg_player = FramePlayer(
+            self.root, count, lambda index: frames.get(key + (index,)), photo.paste,
+            lambda: self._tick_due, _advance if streamed else None,
+        )
+        self._bg_player.start(first[1])
 
-        self.canvas.tag_lower('bg')
+    def _load_tk_frame(self, path: str, index: int) -> None:
+        # Without Pillow, GIF frames are read one per idle callback so a long
+        # animation never blocks a tick; it plays only if it fits the budget.
+        self._tk_frames_after_id = None
+        if path != self.bg_path:
+            return
+        try:
+            frame = tk.PhotoImage(file=path, format=f'gif -index {index}')
+        except tk.TclError:
+            frame = None
+        if frame is not None:
+            self._tk_frames.append((frame, BG_FRAME_DEFAULT_MS))
+            if len(self._tk_frames) * frame.width() * frame.height() * 4 > BG_FRAME_CACHE_BYTES // 2:
+                self._tk_frames = []
+                return
+            self._tk_frames_after_id = self.root.after_idle(self._load_tk_frame, path, index + 1)
+            return
+        if len(self._tk_frames) < 2:
+            self._tk_frames = []
+            return
+        # Copying into the shared PhotoImage updates every display at once.
+        target = self.bg_photo
+        self._bg_player = FramePlayer(
+            self.root, len(self._tk_frames), lambda i: self._tk_frames[i],
+            lambda frame: target.tk.call(target, 'copy', frame), lambda: self._tick_due,
+        )
+        self._bg_player.start(BG_FRAME_DEFAULT_MS)
+
+    def _stop_animation(self) -> None:
+        if self._bg_player is not None:
+            self._bg_player.stop()
+            self._bg_player = None
+        self._bg_animation = None
+        self._bg_stream_pending = False
+        if self._bg_jobs.pop('animation', None) is not None:
+            self._bg_renderer.cancel('animation')
+        if self._tk_frames_after_id is not None:
+            self.root.after_cancel(self._tk_frames_after_id)
+            self._tk_frames_after_id = None
+        self._tk_frames = []
+
+    def _show_background_error(self, exc: Exception) -> None:
+        self._awaiting_first_background = False
+        self.profiler.report()
+        self._cancel_background_fade()
+        self._stop_animation()
+        self.stop_slideshow()
+        self.bg_path = None
+        self._bg_image = self._bg_image_path = None
+        self._clear_main_background()
+        for display in self.displays:
+            display.clear_background()
+        if isinstance(exc, BackgroundSizeError):
+            exc = self.t('dialog_bg_invalid_size')
+        dark_messagebox(self.root, self.t('dialog_bg_error'),
+                        f'{self.t("dialog_bg_load_fail")}: {exc}', error=True,
+                        ok_text=self.t('dialog_ok'))
 
     def format_hms(self, total_seconds: int) -> str:
-        total_seconds = max(total_seconds, 0)
-        total_seconds = min(total_seconds, 359999)  # cap at 99:59:59
-        h = total_seconds // 3600
-        m = (total_seconds % 3600) // 60
-        s = total_seconds % 60
-        return f'{h:02d}:{m:02d}:{s:02d}'
+        return format_hms(total_seconds)
 
     @staticmethod
     def hex_to_rgb(color: str) -> tuple[int, int, int]:
@@ -1290,45 +4482,70 @@ class FullscreenClockApp:
         return f'#{r:02X}{g:02X}{b:02X}'
 
     def get_display_time(self) -> tuple[str, str]:
+        display_time, mode_key = self.display_state()
+        return display_time, self.t(mode_key)
+
+    def display_state(self) -> tuple[str, str]:
+        """Displayed time plus the catalog key of its mode caption."""
         if self.mode == 'clock':
             ts = time.time() + self.clock_offset_seconds
-            return time.strftime('%H:%M:%S', time.localtime(ts)), self.t('mode_clock')
+            return time.strftime('%H:%M:%S', time.localtime(ts)), 'mode_clock'
 
         if self.count_start is None:
             self.count_start = time.time()
 
         if self.paused:
             elapsed = int((self.pause_started_at or time.time()) - self.count_start - self.paused_duration)
-            state = self.t('state_paused')
         else:
             elapsed = int(time.time() - self.count_start - self.paused_duration)
-            state = self.t('state_running')
 
         if self.mode == 'countup':
-            return self.format_hms(elapsed), f"{self.t('mode_countup')} ({state})"
+            key = 'mode_countup_paused' if self.paused else 'mode_countup_running'
+            return self.format_hms(elapsed), key
 
         remain = self.countdown_total - elapsed
         if remain <= 0:
-            return '00:00:00', f"{self.t('mode_countdown')} ({self.t('state_done')})"
-        return self.format_hms(remain), f"{self.t('mode_countdown')} ({state})"
+            return '00:00:00', 'mode_countdown_done'
+        key = 'mode_countdown_paused' if self.paused else 'mode_countdown_running'
+        return self.format_hms(remain), key
 
-    def position_elements(self) -> None:
-        width = self.root.winfo_width()
-        height = self.root.winfo_height()
-        shadow_offset = 3 + self.time_font_size * 0.008
-        self.canvas.coords(self.time_shadow_item, width / 2 + shadow_offset, height * 0.42 + shadow_offset)
-        self.canvas.coords(self.time_item, width / 2, height * 0.42)
-        self.canvas.coords(self.desc_item, width / 2, height * 0.56)
+    def text_layout(self, width: int, height: int) -> tuple[tuple[float, float], ...]:
+        """Canvas positions of the time shadow, time and description text."""
+        blocks = None
+        if self._fitted_sizes is not None:
+            blocks = scene_blocks(self.text_metrics, self, self._fitted_sizes)
+        return scene_layout(width, height, self.effective_font_sizes()[0], blocks)
 
+    def position_elements(self) -> None:
+        shadow, time_pos, desc = self.text_layout(self.root.winfo_width(), self.root.winfo_height())
+        self.canvas.coords(self.time_shadow_item, *shadow)
+        self.canvas.coords(self.time_item, *time_pos)
+        self.canvas.coords(self.desc_item, *desc)
+        if self._glyphs is not None:
+            self._glyphs.place(*time_pos)
+        for display in self.displays:
+            display.position()
+
+    @instrumented('update_ui')
     def update_ui(self) -> None:
+        self._tick_after_id = None
         if not self.running:
             return
-
-        display_time, mode_text = self.get_display_time()
+        if self._tick_due is not None and self.metrics.enabled:
+            self.metrics.record_lateness(max((time.perf_counter() - self._tick_due) * 1000, 0.0))
+        self._tick_due = None
+        if not self.commands.empty():
+            self._run_control_commands()
+
+        strings = language_catalog(self.lang)
+        display_time, mode_key = self.display_state()
+        if self.sync is not None and self.sync.role == 'leader':
+            self.sync.broadcast({key: getattr(self, key) for key in SYNC_FIELDS})
         time_key = (display_time, self.text_color)
         if time_key != self._last_time_key:
-            self.canvas.itemconfigure(self.time_item, text=display_time, fill=self.text_color)
-            self.canvas.itemconfigure(self.time_shadow_item, text=display_time)
+            if not self._draw_glyph_time(display_time):
+                self.canvas.itemconfigure(self.time_item, text=display_time, fill=self.text_color)
+                self.canvas.itemconfigure(self.time_shadow_item, text=display_time)
             self._last_time_key = time_key
 
         desc_key = (self.custom_text, self.desc_color)
@@ -1336,24 +4553,240 @@ class FullscreenClockApp:
             self.canvas.itemconfigure(self.desc_item, text=self.custom_text, fill=self.desc_color)
             self._last_desc_key = desc_key
 
-        status_text = self.version_text()
+        status_text = strings['version_text']
         if status_text != self._last_status_key:
             self.canvas.itemconfigure(self.status_item, text=status_text)
             self._last_status_key = status_text
 
-        mode_label_text = f"{self.t('mode_prefix')}: {mode_text}"
+        mode_label_text = strings[MODE_LABEL_KEYS[mode_key]]
         if self.mode_label is not None:
             if mode_label_text != self._last_mode_label_text:
                 self.mode_label.configure(text=mode_label_text)
                 self._last_mode_label_text = mode_label_text
 
-        self.root.after(200, self.update_ui)
+        for display in self.displays:
+            display.render(display_time)
+
+        if self.frame_server is not None:
+            size = (max(self.root.winfo_width(), 1), max(self.root.winfo_height(), 1))
+            self.frame_server.publish(size, self.scene_snapshot(), display_time)
+
+        delay = self.next_tick_delay()
+        self._tick_due = time.perf_counter() + delay / 1000
+        self._tick_after_id = self.root.after(delay, self.update_ui)
 
+    def _run_control_commands(self) -> None:
+        """Apply one batch of queued control commands.
+
+        Runs of ``set`` and ``set_background`` are merged and applied once,
+        right before the next other command or at the end of the batch, so
+        a script pushing hundreds of style updates costs one restyle.
+        """
+        style: dict = {}
+        background = None
+        merged: list = []
+        resolve = self._resolve_command
+
+        def flush() -> None:
+            nonlocal background
+            error = None
+            try:
+                if background is not None:
+                    self.set_background(background['path'], background['color'])
+                if style:
+                    self.apply_style(style)
+            except Exception as e:
+                error = e
+            for future in merged:
+                resolve(future, error=error)
+            style.clear()
+            merged.clear()
+            background = None
+
+        for name, args, future in take_commands(self.commands):
+            if name == 'set':
+                style.update(args['properties'])
+                merged.append(future)
+                continue
+            if name == 'set_background':
+                background = args
+                merged.append(future)
+                continue
+            flush()
+            try:
+                resolve(future, self._control_command(name, args))
+            except Exception as e:
+                resolve(future, error=e)
+        flush()
+        # This tick is running now; drop any refresh the commands asked for.
+        if self._tick_after_id is not None:
+            self.root.after_cancel(self._tick_after_id)
+            self._tick_after_id = None
+
+    def _resolve_command(self, future, result=None, error: Exception | None = None) -> None:
+        # Sync updates carry no future; nobody waits for a reply.
+        if future is not None and self.control_server is not None:
+            self.control_server.resolve(future, result, error)
+
+    def _apply_sync(self, state: dict) -> None:
+        """Adopt the leader's timer anchors."""
+        changed = [key for key in SYNC_FIELDS if getattr(self, key) != state[key]]
+        if not changed:
+            return
+        for key in changed:
+            setattr(self, key, state[key])
+        self.request_tick()
+        self.save_user_state()
 
-def main() -> None:
+    def _control_command(self, name: str, args: dict):
+        if name == 'set_mode':
+            self.set_mode(args['mode'], args.get('seconds'))
+            self.request_tick()
+            self.save_user_state()
+        elif name == 'set_time_value':
+            self.apply_time_value(args['value'])
+        elif name == 'reset_mode_timer':
+            self.reset_mode_timer()
+        elif name == 'toggle_pause':
+            self.toggle_pause()
+        elif name == 'sync':
+            self._apply_sync(args)
+        elif name == 'get_state':
+            display_time, mode_key = self.display_state()
+            return {'display_time': display_time, 'mode_state': mode_key,
+                    **self.user_state_snapshot()}
+        return None
+
+    def _draw_glyph_time(self, display_time: str) -> bool:
+        """Draw the time from the glyph atlas; False means use the text items."""
+        if self._glyphs is None:
+            return False
+        font_file = self._glyphs.font_file(self.time_font_family, self.time_bold)
+        usable = font_file is not None and all(ch in GLYPH_CHARS for ch in display_time)
+        if usable:
+            if self._pixels_per_point is None:
+                self._pixels_per_point = self.root.winfo_fpixels('1i') / 72
+            time_size = self.effective_font_sizes()[0]
+            shadow_offset = 3 + time_size * 0.008 if self.time_shadow else 0
+            key = (font_file, round(time_size * self._pixels_per_point),
+                   self.text_color, shadow_offset)
+            try:
+                self._glyphs.use(key)
+            except OSError:
+                usable = False  # unreadable font file
+        if usable != self._glyphs_active:
+            self._glyphs_active = usable
+            shadow_state = 'normal' if self.time_shadow and not usable else 'hidden'
+            self.canvas.itemconfigure(self.time_item, state='hidden' if usable else 'normal')
+            self.canvas.itemconfigure(self.time_shadow_item, state=shadow_state)
+            if not usable:
+                self._glyphs.clear()
+        if usable:
+            self._glyphs.render(display_time)
+        return usable
+
+    def next_tick_delay(self) -> int:
+        """Milliseconds until the displayed time next changes."""
+        now = time.time()
+        if self.mode == 'clock':
+            phase = (now + self.clock_offset_seconds) % 1.0
+        elif self.paused or self.count_start is None:
+            return TICK_IDLE_MS
+        else:
+            elapsed = now - self.count_start - self.paused_duration
+            if self.mode == 'countdown' and elapsed >= self.countdown_total:
+                return TICK_IDLE_MS
+            phase = elapsed % 1.0
+        remaining_ms = (1.0 - phase) * 1000
+        # Synced instances always tick precisely so their seconds flip together.
+        if not self.precise_ticks and self.sync is None:
+            return int(remaining_ms) + TICK_SLACK_MS
+        if remaining_ms > TICK_PRECISE_LEAD_MS * 2:
+            return int(remaining_ms) - TICK_PRECISE_LEAD_MS
+        return max(math.ceil(remaining_ms), 1)
+
+    def request_tick(self) -> None:
+        """Refresh the display now instead of waiting for the next boundary."""
+        if self._tick_after_id is not None:
+            self.root.after_cancel(self._tick_after_id)
+        # An unscheduled tick has no boundary to be late for.
+        self._tick_due = None
+        self._tick_after_id = self.root.after(0, self.update_ui)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description='Fullscreen desktop clock')
+    parser.add_argument('--profile-startup', action='store_true',
+                        help='print per-phase startup timings to stdout')
+    parser.add_argument('--metrics', action='store_true',
+                        help='collect callback timings from startup (I shows them, D dumps them)')
+    parser.add_argument('--metrics-dump', metavar='PATH',
+                        help='like --metrics, but D writes to PATH; a .csv name writes CSV, '
+                             'anything else JSON')
+    parser.add_argument('--displays', type=parse_display_geometries, metavar='WxH+X+Y,...',
+                        help='open one clock window per geometry; the first is the main window')
+    parser.add_argument('--slideshow', metavar='FOLDER_OR_PLAYLIST',
+                        help='rotate background images from a folder or a playlist file')
+    parser.add_argument('--slideshow-interval', type=int, metavar='SECONDS',
+                        help=f'seconds per slideshow image (default {SLIDESHOW_DEFAULT_INTERVAL_S})')
+    parser.add_argument('--precise-ticks', action=argparse.BooleanOptionalAction,
+                        help='wake just before each second and again on it, trading one extra '
+                             'wakeup for less timer jitter (saved in user_state.json)')
+    parser.add_argument('--mmap-renditions', action=argparse.BooleanOptionalAction,
+                        help='store the background disk cache as raw pixels that are '
+                             'memory-mapped on load (saved in user_state.json)')
+    parser.add_argument('--glyph-time', action=argparse.BooleanOptionalAction,
+                        help='draw the time from a pre-rendered digit atlas '
+                             '(saved in user_state.json)')
+    parser.add_argument('--serve', type=parse_listen_address, metavar='[HOST:]PORT',
+                        help='serve the clock frame over HTTP (/frame.png, /stream.mjpg); '
+                             f'HOST defaults to {HTTP_DEFAULT_HOST}')
+    parser.add_argument('--control', nargs='?', const='', metavar='SOCKET',
+                        help='accept JSON commands on a Unix socket (default control-<pid>.sock '
+                             'next to the app; not available on Windows)')
+    parser.add_argument('--control-port', type=int, metavar='PORT',
+                        help='accept JSON commands on a loopback TCP port')
+    parser.add_argument('--sync', choices=('leader', 'follower'),
+                        help='tick in step with other clock processes on this host')
+    parser.add_argument('--sync-port', type=int, default=SYNC_DEFAULT_PORT, metavar='PORT',
+                        help=f'UDP port shared by a leader and its followers (default {SYNC_DEFAULT_PORT})')
+    parser.add_argument('--render', metavar='FOLDER',
+                        help='render frames without a window: numbered PNGs in FOLDER, '
+                             'or raw RGB on stdout for "-"')
+    parser.add_argument('--size', type=parse_frame_size, default=HEADLESS_DEFAULT_SIZE, metavar='WxH',
+                        help='frame size for --render (default 1920x1080)')
+    parser.add_argument('--from', dest='time_from', type=parse_hms, default=0, metavar='HH:MM:SS',
+                        help='first time shown by --render (default 00:00:00)')
+    parser.add_argument('--to', dest='time_to', type=parse_hms, metavar='HH:MM:SS',
+                        help='last time shown by --render, one frame per second (default: --from)')
+    parser.add_argument('--state', metavar='PATH',
+                        help='settings file for --render (default: the app\'s user_state.json)')
+    args = parser.parse_args(argv)
+
+    if args.render is not None:
+        if args.render == '-' and getattr(sys.stdout, 'buffer', None) is None:
+            # The windowed exe has no stdout to stream to.
+            parser.error('--render - needs a console; this build has no stdout')
+        sys.exit(run_headless(args))
+
+    control_socket = args.control
+    # asyncio offers Unix servers exactly where the socket module has AF_UNIX.
+    if control_socket is not None and not hasattr(socket, 'AF_UNIX'):
+        parser.error('--control needs Unix sockets, which this platform lacks; use --control-port')
+    if control_socket == '':
+        control_socket = os.path.join(app_runtime_dir(), CONTROL_SOCKET_NAME.format(pid=os.getpid()))
+
+    profiler = StartupProfiler(args.profile_startup)
+    profiler.mark('imports')
     root = tk.Tk()
-    app = FullscreenClockApp(root)
-    app.show_help()
+    profiler.mark('tk_root')
+    FullscreenClockApp(root, profiler=profiler, show_help_on_start=True, metrics=args.metrics or args.metrics_dump is not None,
+                       metrics_dump=args.metrics_dump, displays=args.displays, slideshow=args.slideshow,
+                       slideshow_interval=args.slideshow_interval, serve=args.serve,
+                       control_socket=control_socket, control_port=args.control_port,
+                       sync=args.sync, sync_port=args.sync_port,
+                       precise_ticks=args.precise_ticks, mmap_renditions=args.mmap_renditions,
+                       glyph_time=args.glyph_time)
     root.mainloop()
 
 
@@ -0,0 +1,306 @@
+"""Benchmarks for the clock's render and tick hot paths.
+
+Background decode/resample benchmarks need only Pillow. The Tk benchmarks
+(update_ui ticks, style slider storms, language toggles) need a display;
+on a headless machine run the suite under Xvfb:
+
+    xvfb-run -a py -3 scripts/bench_clock.py --output bench.json
+
+Compare against a stored baseline so slowdowns fail loudly:
+
+    py -3 scripts/bench_clock.py --save-baseline bench_baseline.json
+    py -3 scripts/bench_clock.py --baseline bench_baseline.json --tolerance 0.25
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import clock_app  # noqa: E402
+from clock_app import (  # noqa: E402
+    BackgroundPyramid, BackgroundRenderer, FullscreenClockApp, decode_background,
+    load_pillow,
+)
+
+SOURCE_SIZES = [(1920, 1080), (4000, 3000), (8000, 6000)]
+TARGET_SIZES = [(1280, 720), (1920, 1080), (3840, 2160)]
+ZOOM_LEVELS = [50, 100, 300]
+
+
+class PeakMemory:
+    """Peak memory of a block: Python allocations plus process RSS where known.
+
+    Pillow allocates pixel buffers outside the Python allocator, so RSS is
+    the number that matters for images. On Linux the RSS high-water mark is
+    reset per block via /proc/self/clear_refs; elsewhere it is omitted.
+    """
+
+    def __enter__(self):
+        self.rss_reset = self._reset_rss_peak()
+        self.rss_before = self._rss_kb('VmRSS') if self.rss_reset else None
+        tracemalloc.start()
+        return self
+
+    def __exit__(self, *_exc):
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        self.py_peak_kb = peak // 1024
+        self.rss_peak_kb = None
+        if self.rss_reset:
+            hwm = self._rss_kb('VmHWM')
+            if hwm is not None and self.rss_before is not None:
+                self.rss_peak_kb = max(hwm - self.rss_before, 0)
+        return False
+
+    @staticmethod
+    def _reset_rss_peak() -> bool:
+        try:
+            with open('/proc/self/clear_refs', 'w') as f:
+                f.write('5')
+            return True
+        except OSError:
+            return False
+
+    @staticmethod
+    def _rss_kb(field: str) -> int | None:
+        try:
+            with open('/proc/self/status') as f:
+                for line in f:
+                    if line.startswith(field + ':'):
+                        return int(line.split()[1])
+        except OSError:
+            return None
+        return None
+
+
+def measure(name: str, fn, *, repeat: int, results: list, **meta) -> None:
+    # Timed runs go first; tracemalloc slows allocation-heavy code a lot, so
+    # memory is sampled in one extra run afterwards.
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    with PeakMemory() as mem:
+        fn()
+    entry = {
+        'name': name,
+        'median_ms': round(statistics.median(timings), 3),
+        'min_ms': round(min(timings), 3),
+        'repeat': repeat,
+        'py_peak_kb': mem.py_peak_kb,
+        'rss_peak_kb': mem.rss_peak_kb,
+    }
+    entry.update(meta)
+    results.append(entry)
+    print(f"  {name:<48} {entry['median_ms']:10.2f} ms  (min {entry['min_ms']:.2f})", file=sys.stderr)
+
+
+def make_sources(directory: str, sizes: list[tuple[int, int]]) -> dict:
+    from PIL import Image, ImageDraw
+
+    paths = {}
+    for w, h in sizes:
+        img = Image.linear_gradient('L').resize((w, h)).convert('RGB')
+        draw = ImageDraw.Draw(img)
+        for i in range(0, w, max(w // 16, 1)):
+            draw.line((i, 0, w - i, h), fill=(i % 255, 80, 160), width=3)
+        path = os.path.join(directory, f'src_{w}x{h}.jpg')
+        img.save(path, quality=90)
+        paths[(w, h)] = path
+    return paths
+
+
+def bench_backgrounds(results: list, quick: bool) -> None:
+    print('background:', file=sys.stderr)
+    sources = SOURCE_SIZES[:2] if quick else SOURCE_SIZES
+    targets = TARGET_SIZES[:2] if quick else TARGET_SIZES
+    repeat = 3 if quick else 5
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = make_sources(tmp, sources)
+        for (sw, sh), path in paths.items():
+            for tw, th in targets:
+                for zoom in ZOOM_LEVELS:
+                    tag = f'{sw}x{sh}->{tw}x{th}@{zoom}%'
+                    meta = {'source': [sw, sh], 'target': [tw, th], 'zoom': zoom}
+                    measure(f'bg_cold {tag}',
+                            lambda: BackgroundRenderer._resample(
+                                BackgroundPyramid(*decode_background(path, tw, th, zoom)), tw, th, zoom),
+                            repeat=repeat, results=results, **meta)
+                    pyramid = BackgroundPyramid(*decode_background(path, tw, th, zoom))
+                    measure(f'bg_warm {tag}',
+                            lambda: BackgroundRenderer._resample(pyramid, tw, th, zoom),
+                            repeat=repeat, results=results, **meta)
+                    measure(f'bg_preview {tag}',
+                            lambda: BackgroundRenderer._resample(pyramid, tw, th, zoom, preview=True),
+                            repeat=repeat, results=results, **meta)
+
+
+def bench_format(results: list, quick: bool) -> None:
+    print('format:', file=sys.stderr)
+    count = 10_000
+    fmt = FullscreenClockApp.format_hms
+
+    def run() -> None:
+        for n in range(count):
+            fmt(None, n * 37)
+
+    measure(f'format_hms x{count}', run, repeat=3 if quick else 5, results=results)
+
+
+def make_app(tmp: str):
+    import tkinter as tk
+
+    state_file = os.path.join(tmp, 'user_state.json')
+
+    class BenchClockApp(FullscreenClockApp):
+        def state_path(self) -> str:
+            return state_file
+
+    root = tk.Tk()
+    root.geometry('1280x720')
+    app = BenchClockApp(root)
+    root.update()
+    return root, app
+
+
+def bench_tk(results: list, quick: bool) -> None:
+    import tkinter as tk
+
+    try:
+        probe = tk.Tk()
+        probe.destroy()
+    except tk.TclError as exc:
+        print(f'tk: skipped ({exc})', file=sys.stderr)
+        results.append({'name': 'tk', 'skipped': str(exc)})
+        return
+
+    print('tk:', file=sys.stderr)
+    ticks = 2_000 if quick else 10_000
+    with tempfile.TemporaryDirectory() as tmp:
+        root, app = make_app(tmp)
+
+        def run_ticks(step_offset: bool) -> None:
+            for _ in range(ticks):
+                if step_offset:
+                    app.clock_offset_seconds = (app.clock_offset_seconds + 1) % 86400
+                app.update_ui()
+                root.after_cancel(app._tick_after_id)
+                app._tick_after_id = None
+            root.update_idletasks()
+
+        measure(f'update_ui steady x{ticks}', lambda: run_ticks(False), repeat=3, results=results)
+        measure(f'update_ui changing x{ticks}', lambda: run_ticks(True), repeat=3, results=results)
+
+        def run_display_time() -> None:
+            for _ in range(ticks):
+                app.get_display_time()
+
+        app.mode = 'countdown'
+        app.countdown_total = 3600
+        app.count_start = time.time()
+        measure(f'get_display_time x{ticks}', run_display_time, repeat=3, results=results)
+        app.mode = 'clock'
+
+        app.open_style_panel()
+        root.update()
+        events = 100 if quick else 500
+
+        def slider_storm() -> None:
+            for i in range(events):
+                app.time_size_scale.set(24 + i % 200)
+                app.bg_size_scale.set(20 + i % 280)
+                app._apply_style()
+                if i % 8 == 0:
+                    root.update()
+            root.update()
+
+        measure(f'style slider storm x{events}', slider_storm, repeat=3, results=results)
+
+        toggles = 50 if quick else 200
+
+        def language_toggles() -> None:
+            for _ in range(toggles):
+                app.toggle_language()
+            root.update_idletasks()
+
+        measure(f'language toggles x{toggles}', language_toggles, repeat=3, results=results)
+        app.quit_app()
+
+
+def compare(results: list, baseline_path: str, tolerance: float) -> list:
+    with open(baseline_path, 'r', encoding='utf-8') as f:
+        baseline = {r['name']: r for r in json.load(f)['results'] if 'median_ms' in r}
+    regressions = []
+    for entry in results:
+        base = baseline.get(entry['name'])
+        if base is None or 'median_ms' not in entry:
+            continue
+        ratio = entry['median_ms'] / max(base['median_ms'], 1e-6)
+        entry['baseline_ms'] = base['median_ms']
+        entry['ratio'] = round(ratio, 3)
+        if ratio > 1.0 + tolerance:
+            regressions.append(entry)
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--quick', action='store_true', help='smaller sizes and fewer repeats')
+    parser.add_argument('--only', choices=['background', 'format', 'tk'], action='append',
+                        help='run only the named group (repeatable)')
+    parser.add_argument('--output', help='write JSON results here instead of stdout')
+    parser.add_argument('--baseline', help='compare against a saved results file')
+    parser.add_argument('--save-baseline', help='also write results as a new baseline')
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help='allowed slowdown vs. baseline before failing (default 0.25 = 25%%)')
+    args = parser.parse_args(argv)
+
+    if not load_pillow():
+        print('Pillow is required for the benchmarks', file=sys.stderr)
+        return 2
+
+    groups = args.only or ['background', 'format', 'tk']
+    results: list = []
+    if 'background' in groups:
+        bench_backgrounds(results, args.quick)
+    if 'format' in groups:
+        bench_format(results, args.quick)
+    if 'tk' in groups:
+        bench_tk(results, args.quick)
+
+    regressions = compare(results, args.baseline, args.tolerance) if args.baseline else []
+    report = {
+        'app_version': clock_app.APP_VERSION,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'quick': args.quick,
+        'results': results,
+        'regressions': [r['name'] for r in regressions],
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(text)
+    else:
+        print(text)
+    if args.save_baseline:
+        with open(args.save_baseline, 'w', encoding='utf-8') as f:
+            f.write(text)
+
+    for entry in regressions:
+        print(f"REGRESSION {entry['name']}: {entry['median_ms']:.2f} ms vs baseline "
+              f"{entry['baseline_ms']:.2f} ms (x{entry['ratio']})", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())